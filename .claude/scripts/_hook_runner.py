@@ -0,0 +1,65 @@
+#!/usr/bin/env python3
+"""
+Warm worker entry points for running hooks in-process.
+Used by validate-hooks.py so each hook doesn't pay interpreter start-up.
+"""
+
+import contextlib
+import io
+import json
+import os
+import runpy
+import sys
+import traceback
+
+# Modules nearly every hook imports - loaded once per worker
+COMMON_MODULES = ["json", "sys", "os", "re", "pathlib", "datetime", "subprocess"]
+
+def init_worker():
+    """Pre-import the modules hooks share so each run starts warm."""
+    for name in COMMON_MODULES:
+        __import__(name)
+
+def run_hook(hook_path, test_input):
+    """Run a hook as __main__ with test_input on stdin.
+
+    Returns (exit_code, stdout) like a `python3 hook.py` subprocess would:
+    the hook's directory is first on sys.path and its stderr is captured
+    rather than printed.
+    """
+    stdout = io.StringIO()
+    stderr = io.StringIO()
+    cwd = os.getcwd()
+    saved_stdin, saved_argv, saved_path = sys.stdin, sys.argv, sys.path[:]
+    sys.stdin = io.StringIO(json.dumps(test_input))
+    sys.argv = [hook_path]
+    sys.path.insert(0, os.path.dirname(os.path.abspath(hook_path)))
+    exit_code = 0
+
+    with contextlib.redirect_stdout(stdout), contextlib.redirect_stderr(stderr):
+        try:
+            runpy.run_path(hook_path, run_name="__main__")
+        except SystemExit as e:
+            if e.code is None:
+                exit_code = 0
+            elif isinstance(e.code, int):
+                exit_code = e.code
+            else:
+                print(e.code, file=sys.stderr)
+                exit_code = 1
+        except Exception:
+            traceback.print_exc()
+            exit_code = 1
+        finally:
+            sys.stdin, sys.argv = saved_stdin, saved_argv
+            sys.path[:] = saved_path
+            os.chdir(cwd)
+
+    return exit_code, stdout.getvalue()
+
+def send_hook_result(conn, hook_path, test_input):
+    """Process target: run one hook and send (exit_code, stdout) back over conn."""
+    try:
+        conn.send(run_hook(hook_path, test_input))
+    finally:
+        conn.close()
@@ -0,0 +1,78 @@
+#!/usr/bin/env bash
+# Adaptive worktree monitor used by the AppleScript dashboard
+# Usage: _wt_adaptive_monitor.sh <name> <path>
+#
+# Refreshes `git status` on a cadence that backs off as the worktree goes idle:
+#   hot  (changed < 5 min ago)   every 5s
+#   warm (changed < 30 min ago)  every 30s
+#   cold (changed < 1 hour ago)  every 5 min
+#   frozen (idle > 1 hour)       checked every 5 min, redrawn only on a change
+#                                or on SIGUSR1
+# Commits, staging and ledger updates are spotted every 5s with bash's -nt test
+# against a marker file, without running git. Working-tree edits only show up
+# in `git status`, so every refresh compares its output with the previous one.
+# Any change puts the pane back in the hot tier. The 5s wait itself is a
+# backgrounded `sleep`, so SIGUSR1 can cut it short.
+
+name="$1"
+cd "$2" || exit 1
+
+git_dir=$(git rev-parse --absolute-git-dir 2>/dev/null)
+marker=$(mktemp -t wt-monitor.XXXXXX)
+trap 'rm -f "$marker"' EXIT
+trap 'exit 0' INT TERM HUP
+trap 'force=1' USR1
+
+changed() {
+    [ "$git_dir/HEAD" -nt "$marker" ] || [ "$git_dir/index" -nt "$marker" ] || [ .task-ledger.md -nt "$marker" ]
+}
+
+# refresh <tier> <quiet>: with quiet=1, only redraw if `git status` changed
+refresh() {
+    touch "$marker"
+    last_refresh=$SECONDS
+    new_status=$(git status --porcelain 2>/dev/null)
+    if [ "$new_status" != "$status" ]; then
+        status=$new_status
+        last_change=$SECONDS
+    elif [ "$2" = 1 ]; then
+        return
+    fi
+    clear
+    echo "🌳 $name"
+    [ -n "$status" ] && printf '%s\n' "$status"
+    echo ""
+    tail -n 20 .task-ledger.md 2>/dev/null || echo "No task ledger"
+    echo ""
+    echo "(tier: $1 - kill -USR1 $$ to refresh now)"
+}
+
+status=""
+last_change=$SECONDS
+last_refresh=$SECONDS
+force=1
+
+while true; do
+    if changed; then
+        last_change=$SECONDS
+        force=1
+    fi
+
+    idle=$((SECONDS - last_change))
+    if [ $idle -lt 300 ]; then tier=hot; interval=5
+    elif [ $idle -lt 1800 ]; then tier=warm; interval=30
+    elif [ $idle -lt 3600 ]; then tier=cold; interval=300
+    else tier=frozen; interval=300
+    fi
+
+    if [ "$force" = 1 ] || [ $((SECONDS - last_refresh)) -ge $interval ]; then
+        quiet=0
+        [ "$tier" = frozen ] && [ "$force" = 0 ] && quiet=1
+        force=0
+        refresh "$tier" "$quiet"
+    fi
+
+    # wait returns early when SIGUSR1 arrives
+    sleep 5 &
+    wait $!
+done
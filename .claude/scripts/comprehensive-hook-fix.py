@@ -9,6 +9,35 @@ import sys
 import json
 from pathlib import Path
 
+# "action" field rewrites per hook event type, applied in order.
+# Compiled once here rather than on every hook file.
+_DECISION_BLOCK = (re.compile(r'["\']action["\']\s*:\s*["\']block["\']'), '"decision": "block"')
+_POST_TOOL_REWRITES = [
+    # These can use decision field
+    _DECISION_BLOCK,
+    # Replace continue/allow with exit codes
+    (re.compile(r'print\s*\(\s*json\.dumps\s*\(\s*\{\s*["\']action["\']\s*:\s*["\']continue["\']\s*\}\s*\)\s*\)'),
+     'sys.exit(0)'),
+]
+ACTION_REWRITES = {
+    # Replace action fields with proper format
+    "PreToolUse": [
+        _DECISION_BLOCK,
+        (re.compile(r'["\']action["\']\s*:\s*["\']approve["\']'), '"decision": "approve"'),
+        (re.compile(r'["\']action["\']\s*:\s*["\']continue["\']'), 'sys.exit(0)  # Continue'),
+        (re.compile(r'["\']action["\']\s*:\s*["\']allow["\']'), 'sys.exit(0)  # Allow'),
+    ],
+    "PostToolUse": _POST_TOOL_REWRITES,
+    "Stop": _POST_TOOL_REWRITES,
+    "SubagentStop": _POST_TOOL_REWRITES,
+    # Notification hooks just use exit codes
+    "Notification": [
+        (re.compile(r'["\']action["\']\s*:\s*["\']notify["\']'), 'sys.exit(0)  # Show notification'),
+        (re.compile(r'print\s*\(\s*json\.dumps\s*\(\s*\{[^}]*["\']action["\']\s*:[^}]*\}\s*\)\s*\)'),
+         'sys.exit(0)'),
+    ],
+}
+
 class ComprehensiveHookFixer:
     def __init__(self):
         self.hooks_dir = Path(".claude/hooks")
@@ -38,55 +67,8 @@ class ComprehensiveHookFixer:
             content = '\n'.join(lines)
         
         # Fix all "action" field occurrences
-        if hook_type == "PreToolUse":
-            # Replace action fields with proper format
-            content = re.sub(
-                r'["\']action["\']\s*:\s*["\']block["\']',
-                '"decision": "block"',
-                content
-            )
-            content = re.sub(
-                r'["\']action["\']\s*:\s*["\']approve["\']',
-                '"decision": "approve"',
-                content
-            )
-            content = re.sub(
-                r'["\']action["\']\s*:\s*["\']continue["\']',
-                'sys.exit(0)  # Continue',
-                content
-            )
-            content = re.sub(
-                r'["\']action["\']\s*:\s*["\']allow["\']',
-                'sys.exit(0)  # Allow',
-                content
-            )
-            
-        elif hook_type in ["PostToolUse", "Stop", "SubagentStop"]:
-            # These can use decision field
-            content = re.sub(
-                r'["\']action["\']\s*:\s*["\']block["\']',
-                '"decision": "block"',
-                content
-            )
-            # Replace continue/allow with exit codes
-            content = re.sub(
-                r'print\s*\(\s*json\.dumps\s*\(\s*\{\s*["\']action["\']\s*:\s*["\']continue["\']\s*\}\s*\)\s*\)',
-                'sys.exit(0)',
-                content
-            )
-            
-        elif hook_type == "Notification":
-            # Notification hooks just use exit codes
-            content = re.sub(
-                r'["\']action["\']\s*:\s*["\']notify["\']',
-                'sys.exit(0)  # Show notification',
-                content
-            )
-            content = re.sub(
-                r'print\s*\(\s*json\.dumps\s*\(\s*\{[^}]*["\']action["\']\s*:[^}]*\}\s*\)\s*\)',
-                'sys.exit(0)',
-                content
-            )
+        for pattern, replacement in ACTION_REWRITES.get(hook_type, []):
+            content = pattern.sub(replacement, content)
         
         # Fix research-capture.py which has no main function
         if 'research-capture.py' in str(file_path) and 'def main' not in content:
@@ -7,6 +7,9 @@ import json
 import re
 from pathlib import Path
 
+# Old "action" keys in either quote style, renamed to "decision" in one pass
+ACTION_FIELD = re.compile(r"""(["'])action\1\s*:""")
+
 def cleanup_settings():
     """Remove references to non-existent hook files."""
     settings_path = Path(".claude/settings.json")
@@ -42,14 +45,6 @@ def fix_remaining_action_fields():
     """Do a final pass to fix any remaining action fields."""
     hooks_dir = Path(".claude/hooks")
     
-    # Pattern to find any remaining action field usage
-    action_patterns = [
-        (r'"action"\s*:', '"decision":'),
-        (r"'action'\s*:", "'decision':"),
-        (r'{\s*"action"\s*:\s*"continue"\s*}', '{}'),
-        (r"{\s*'action'\s*:\s*'continue'\s*}", '{}'),
-    ]
-    
     for hook_file in hooks_dir.rglob('*.py'):
         if '.backup' in str(hook_file):
             continue
@@ -60,9 +55,8 @@ def fix_remaining_action_fields():
             
             original = content
             
-            # Apply all patterns
-            for pattern, replacement in action_patterns:
-                content = re.sub(pattern, replacement, content)
+            # Rename any remaining action field usage
+            content = ACTION_FIELD.sub(r'\1decision\1:', content)
             
             # Special handling for specific patterns
             if '"action": "continue"' in content or "'action': 'continue'" in content:
@@ -12,6 +12,20 @@ import shutil
 from pathlib import Path
 from datetime import datetime
 
+# Rewrite and detection patterns, compiled once rather than per hook file
+ACTION_CONTINUE_PRINT = re.compile(r'print\(json\.dumps\(\s*\{\s*"action"\s*:\s*"continue"\s*\}\s*\)\)')
+ACTION_BLOCK_PRINT = re.compile(
+    r'print\(json\.dumps\(\s*\{\s*"action"\s*:\s*"block"\s*,\s*"message"\s*:\s*([^}]+)\s*\}\s*\)\)'
+)
+ACTION_BLOCK_FIELD = re.compile(r'"action"\s*:\s*"block"')
+ACTION_WARN_PRINT = re.compile(
+    r'print\(json\.dumps\(\s*\{\s*"action"\s*:\s*"warn"\s*,\s*"message"\s*:\s*([^,}]+).*?\}\s*\)\)'
+)
+ACTION_APPROVE_FIELD = re.compile(r'"action"\s*:\s*"approve"')
+WARN_RESPONSE = re.compile(r'response\s*=\s*\{\s*"action"\s*:\s*"warn"[^}]*\}')
+MAIN_BODY = re.compile(r'def main\(\)[^:]*:.*?(?=\ndef|\nif __name__|$)', re.DOTALL)
+SYS_EXIT_CALL = re.compile(r'sys\.exit\s*\(\s*\d+\s*\)')
+
 class HookFixer:
     def __init__(self):
         self.hooks_dir = Path(".claude/hooks")
@@ -114,60 +128,42 @@ class HookFixer:
         
         # Fix action: continue patterns
         if 'action_continue_pattern' in issues:
-            content = re.sub(
-                r'print\(json\.dumps\(\s*\{\s*"action"\s*:\s*"continue"\s*\}\s*\)\)',
-                'sys.exit(0)',
-                content
-            )
+            content = ACTION_CONTINUE_PRINT.sub('sys.exit(0)', content)
         
         # Fix action: block patterns based on hook type
         if 'action_block_pattern' in issues:
             if hook_type == 'pre-tool-use':
                 # For PreToolUse, blocking should use exit code 2
-                content = re.sub(
-                    r'print\(json\.dumps\(\s*\{\s*"action"\s*:\s*"block"\s*,\s*"message"\s*:\s*([^}]+)\s*\}\s*\)\)',
+                content = ACTION_BLOCK_PRINT.sub(
                     r'print(\1, file=sys.stderr)\n        sys.exit(2)',
                     content
                 )
             elif hook_type in ['post-tool-use', 'stop']:
                 # For PostToolUse and Stop, use decision field
-                content = re.sub(
-                    r'"action"\s*:\s*"block"',
-                    '"decision": "block"',
-                    content
-                )
+                content = ACTION_BLOCK_FIELD.sub('"decision": "block"', content)
         
         # Fix action: warn patterns (convert to non-blocking with exit 0)
         if 'action_warn_pattern' in issues:
             # Extract the message and print to stdout, then exit 0
-            content = re.sub(
-                r'print\(json\.dumps\(\s*\{\s*"action"\s*:\s*"warn"\s*,\s*"message"\s*:\s*([^,}]+).*?\}\s*\)\)',
+            content = ACTION_WARN_PRINT.sub(
                 r'print(\1)  # Warning shown in transcript\n        sys.exit(0)',
                 content
             )
         
         # Fix action: approve patterns (PreToolUse only)
         if 'action_approve_pattern' in issues and hook_type == 'pre-tool-use':
-            content = re.sub(
-                r'"action"\s*:\s*"approve"',
-                '"decision": "approve"',
-                content
-            )
+            content = ACTION_APPROVE_FIELD.sub('"decision": "approve"', content)
         
         # Fix generic action field usage
-        content = re.sub(
-            r'response\s*=\s*\{\s*"action"\s*:\s*"warn"[^}]*\}',
-            'sys.exit(0)  # Continue normally',
-            content
-        )
+        content = WARN_RESPONSE.sub('sys.exit(0)  # Continue normally', content)
         
         # Ensure all paths have proper exit codes at the end of main()
         if 'main()' in content and 'missing_exit_codes' in issues:
             # Add sys.exit(0) at the end of main if not present
-            main_match = re.search(r'def main\(\)[^:]*:.*?(?=\ndef|\nif __name__|$)', content, re.DOTALL)
+            main_match = MAIN_BODY.search(content)
             if main_match:
                 main_content = main_match.group(0)
-                if not re.search(r'sys\.exit\s*\(\s*\d+\s*\)', main_content):
+                if not SYS_EXIT_CALL.search(main_content):
                     # Add sys.exit(0) before the last line of main
                     content = content.replace(
                         'if __name__ == "__main__":\n    main()',
@@ -3,8 +3,11 @@
 Comprehensive system audit to ensure all automations, workflows, and commands are synced.
 """
 
+import io
 import json
 import os
+import sys
+from contextlib import redirect_stdout
 from pathlib import Path
 from collections import defaultdict
 
@@ -14,26 +17,59 @@ class SystemAuditor:
         self.issues = []
         self.warnings = []
         self.successes = []
+        self._json_cache = {}
+        self._commands = None
+        
+    def _load_json(self, path: Path):
+        """Parse a JSON file once; later audits reuse the result."""
+        key = str(path)
+        if key not in self._json_cache:
+            with open(path, 'r') as f:
+                self._json_cache[key] = json.load(f)
+        return self._json_cache[key]
+        
+    def _command_names(self) -> set:
+        """Names of all command .md files, from one scandir per directory."""
+        if self._commands is None:
+            self._commands = set()
+            pending = [self.claude_dir / "commands"]
+            while pending:
+                try:
+                    with os.scandir(pending.pop()) as entries:
+                        for entry in entries:
+                            if entry.is_dir(follow_symlinks=False):
+                                pending.append(entry.path)
+                            elif entry.name.endswith(".md"):
+                                self._commands.add(entry.name[:-3])
+                except OSError:
+                    continue
+        return self._commands
         
     def audit_all(self):
         """Run comprehensive system audit."""
-        print("🔍 COMPREHENSIVE SYSTEM AUDIT\n")
-        print("=" * 60)
-        
-        # 1. Audit command definitions vs aliases
-        self.audit_commands_and_aliases()
-        
-        # 2. Audit hook configurations
-        self.audit_hook_configurations()
-        
-        # 3. Audit workflow integrations
-        self.audit_workflow_integrations()
-        
-        # 4. Audit config synchronization
-        self.audit_config_sync()
-        
-        # 5. Generate report
-        self.generate_audit_report()
+        # Collect the per-check lines and write them out in one go
+        buffer = io.StringIO()
+        try:
+            with redirect_stdout(buffer):
+                print("🔍 COMPREHENSIVE SYSTEM AUDIT\n")
+                print("=" * 60)
+                
+                # 1. Audit command definitions vs aliases
+                self.audit_commands_and_aliases()
+                
+                # 2. Audit hook configurations
+                self.audit_hook_configurations()
+                
+                # 3. Audit workflow integrations
+                self.audit_workflow_integrations()
+                
+                # 4. Audit config synchronization
+                self.audit_config_sync()
+                
+                # 5. Generate report
+                self.generate_audit_report()
+        finally:
+            sys.stdout.write(buffer.getvalue())
         
     def audit_commands_and_aliases(self):
         """Check that all aliases point to existing commands."""
@@ -41,17 +77,10 @@ class SystemAuditor:
         
         # Load aliases
         aliases_path = self.claude_dir / "aliases.json"
-        with open(aliases_path, 'r') as f:
-            aliases = json.load(f)
+        aliases = self._load_json(aliases_path)
         
         # Get all command files
-        commands_dir = self.claude_dir / "commands"
-        command_files = set()
-        
-        for cmd_file in commands_dir.rglob("*.md"):
-            if not cmd_file.is_dir():
-                command_name = cmd_file.stem
-                command_files.add(command_name)
+        command_files = self._command_names()
         
         # Check each alias
         missing_commands = []
@@ -80,13 +109,11 @@ class SystemAuditor:
         
         # Load settings
         settings_path = self.claude_dir / "settings.json"
-        with open(settings_path, 'r') as f:
-            settings = json.load(f)
+        settings = self._load_json(settings_path)
         
         # Load config.json for hook-specific settings
         config_path = self.claude_dir / "config.json"
-        with open(config_path, 'r') as f:
-            config = json.load(f)
+        config = self._load_json(config_path)
         
         # Check hook-triggered features
         print("### Hook-Triggered Features:")
@@ -167,7 +194,7 @@ class SystemAuditor:
         }
         
         # Load command files to check
-        commands_dir = self.claude_dir / "commands"
+        command_files = self._command_names()
         
         for workflow_name, commands in workflows.items():
             print(f"### {workflow_name}:")
@@ -175,13 +202,7 @@ class SystemAuditor:
             
             for cmd_name, description in commands:
                 # Check if command exists
-                cmd_path = None
-                for cmd_file in commands_dir.rglob("*.md"):
-                    if cmd_file.stem == cmd_name:
-                        cmd_path = cmd_file
-                        break
-                
-                if cmd_path:
+                if cmd_name in command_files:
                     print(f"   ✅ {cmd_name}: {description}")
                 else:
                     print(f"   ❌ {cmd_name}: MISSING")
@@ -206,8 +227,7 @@ class SystemAuditor:
         config_data = {}
         for name, path in configs.items():
             if path.exists():
-                with open(path, 'r') as f:
-                    config_data[name] = json.load(f)
+                config_data[name] = self._load_json(path)
                 print(f"✅ Found: {name}")
             else:
                 print(f"❌ Missing: {name}")
@@ -3,20 +3,96 @@
 Comprehensive test suite for worktree and multi-perspective review integration
 """
 
+import io
 import json
-import subprocess
 import sys
-from pathlib import Path
 import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+SHEBANG = b"#!/usr/bin/env python3"
+CLAUDE_DIR = ".claude"
+
+# (name relative to .claude, precomputed path string)
+REQUIRED_FILES = [
+    (file, os.path.join(CLAUDE_DIR, file))
+    for file in [
+        # Commands
+        "commands/worktree-parallel.md",
+        "commands/worktree-status.md",
+        "commands/worktree-list.md",
+        "commands/review-perspectives.md",
+        
+        # Scripts
+        "scripts/worktree/worktree_manager.py",
+        "scripts/worktree/worktree_applescript.py",
+        
+        # Hooks
+        "hooks/pre-tool-use/24-worktree-integration.py",
+        
+        # Documentation
+        "docs/WORKTREE_AND_REVIEW_GUIDE.md"
+    ]
+]
+
+COMMAND_FILES = [
+    (cmd, os.path.join(CLAUDE_DIR, "commands", f"{cmd}.md"))
+    for cmd in [
+        "worktree-parallel",
+        "worktree-status",
+        "worktree-list",
+        "review-perspectives"
+    ]
+]
+
+def _shebang_ok(path):
+    """Check the shebang from the first 64 bytes without text decoding"""
+    fd = os.open(path, os.O_RDONLY)
+    try:
+        data = os.read(fd, 64)
+    finally:
+        os.close(fd)
+    return data.split(b"\n", 1)[0].rstrip() == SHEBANG
 
 class IntegrationTester:
     def __init__(self):
         self.results = {
-            'passed': [],
-            'failed': [],
-            'warnings': []
+            'passed': io.StringIO(),
+            'failed': io.StringIO(),
+            'warnings': io.StringIO()
         }
-        self.claude_dir = Path('.claude')
+        self._counts = {'passed': 0, 'failed': 0, 'warnings': 0}
+        self.claude_dir = Path(CLAUDE_DIR)
+        self._local = threading.local()
+        
+    def record(self, bucket, line):
+        """Buffer a result line for print_results"""
+        records = getattr(self._local, 'records', None)
+        if records is not None:
+            records.append((bucket, line))
+            return
+        self.results[bucket].write(f"   {line}\n")
+        self._counts[bucket] += 1
+        
+    def section(self, title):
+        """Print a test section header (held back while tests run concurrently)"""
+        headers = getattr(self._local, 'headers', None)
+        if headers is not None:
+            headers.append(title)
+        else:
+            print(title)
+            
+    def _run_buffered(self, test):
+        """Run one test on a worker thread, keeping its output local"""
+        self._local.headers = []
+        self._local.records = []
+        try:
+            test()
+            return self._local.headers, self._local.records
+        finally:
+            self._local.headers = None
+            self._local.records = None
         
     def run_tests(self):
         """Run all integration tests"""
@@ -24,94 +100,78 @@ class IntegrationTester:
         print("=" * 60)
         
         # Test categories
-        self.test_file_structure()
-        self.test_command_registration()
-        self.test_hook_integration()
-        self.test_chain_configuration()
-        self.test_alias_configuration()
-        self.test_git_worktree_support()
-        self.test_applescript_integration()
-        self.test_next_command_suggestions()
+        tests = [
+            self.test_file_structure,
+            self.test_command_registration,
+            self.test_hook_integration,
+            self.test_chain_configuration,
+            self.test_alias_configuration,
+            self.test_git_worktree_support,
+            self.test_applescript_integration,
+            self.test_next_command_suggestions
+        ]
+        
+        # Run concurrently, then replay output in the original test order
+        with ThreadPoolExecutor(max_workers=len(tests)) as executor:
+            futures = [executor.submit(self._run_buffered, test) for test in tests]
+        for future in futures:
+            headers, records = future.result()
+            for title in headers:
+                print(title)
+            for bucket, line in records:
+                self.record(bucket, line)
         
         # Print results
         self.print_results()
         
     def test_file_structure(self):
         """Test that all required files exist"""
-        print("\n📁 Testing File Structure...")
-        
-        required_files = [
-            # Commands
-            "commands/worktree-parallel.md",
-            "commands/worktree-status.md",
-            "commands/worktree-list.md",
-            "commands/review-perspectives.md",
-            
-            # Scripts
-            "scripts/worktree/worktree_manager.py",
-            "scripts/worktree/worktree_applescript.py",
-            
-            # Hooks
-            "hooks/pre-tool-use/24-worktree-integration.py",
-            
-            # Documentation
-            "docs/WORKTREE_AND_REVIEW_GUIDE.md"
-        ]
+        self.section("\n📁 Testing File Structure...")
         
-        for file in required_files:
-            path = self.claude_dir / file
-            if path.exists():
-                self.results['passed'].append(f"✅ File exists: {file}")
+        for file, path in REQUIRED_FILES:
+            if os.path.exists(path):
+                self.record('passed', f"✅ File exists: {file}")
             else:
-                self.results['failed'].append(f"❌ Missing file: {file}")
+                self.record('failed', f"❌ Missing file: {file}")
                 
     def test_command_registration(self):
         """Test that commands are properly registered"""
-        print("\n📝 Testing Command Registration...")
-        
-        commands = [
-            "worktree-parallel",
-            "worktree-status",
-            "worktree-list",
-            "review-perspectives"
-        ]
+        self.section("\n📝 Testing Command Registration...")
         
-        for cmd in commands:
-            cmd_file = self.claude_dir / f"commands/{cmd}.md"
-            if cmd_file.exists():
-                content = cmd_file.read_text()
+        for cmd, path in COMMAND_FILES:
+            if os.path.exists(path):
+                with open(path) as f:
+                    content = f.read()
                 if f"name: {cmd}" in content:
-                    self.results['passed'].append(f"✅ Command registered: {cmd}")
+                    self.record('passed', f"✅ Command registered: {cmd}")
                 else:
-                    self.results['failed'].append(f"❌ Command misconfigured: {cmd}")
+                    self.record('failed', f"❌ Command misconfigured: {cmd}")
                     
     def test_hook_integration(self):
         """Test hook configuration"""
-        print("\n🪝 Testing Hook Integration...")
+        self.section("\n🪝 Testing Hook Integration...")
         
         # Check if hook is executable
         hook_path = self.claude_dir / "hooks/pre-tool-use/24-worktree-integration.py"
         if hook_path.exists():
             # Check shebang
-            with open(hook_path) as f:
-                first_line = f.readline().strip()
-                if first_line == "#!/usr/bin/env python3":
-                    self.results['passed'].append("✅ Hook has correct shebang")
-                else:
-                    self.results['failed'].append("❌ Hook missing proper shebang")
+            if _shebang_ok(hook_path):
+                self.record('passed', "✅ Hook has correct shebang")
+            else:
+                self.record('failed', "❌ Hook missing proper shebang")
                     
             # Check if it's in ACTIVE_HOOKS.md
             active_hooks = self.claude_dir / "hooks/ACTIVE_HOOKS.md"
             if active_hooks.exists():
                 content = active_hooks.read_text()
                 if "24-worktree-integration.py" in content:
-                    self.results['passed'].append("✅ Hook listed in ACTIVE_HOOKS.md")
+                    self.record('passed', "✅ Hook listed in ACTIVE_HOOKS.md")
                 else:
-                    self.results['warnings'].append("⚠️  Hook not listed in ACTIVE_HOOKS.md")
+                    self.record('warnings', "⚠️  Hook not listed in ACTIVE_HOOKS.md")
                     
     def test_chain_configuration(self):
         """Test chains.json configuration"""
-        print("\n⛓️  Testing Chain Configuration...")
+        self.section("\n⛓️  Testing Chain Configuration...")
         
         chains_file = self.claude_dir / "chains.json"
         if chains_file.exists():
@@ -129,9 +189,9 @@ class IntegrationTester:
             
             for chain in required_chains:
                 if chain in chains.get("chains", {}):
-                    self.results['passed'].append(f"✅ Chain configured: {chain}")
+                    self.record('passed', f"✅ Chain configured: {chain}")
                 else:
-                    self.results['failed'].append(f"❌ Chain missing: {chain}")
+                    self.record('failed', f"❌ Chain missing: {chain}")
                     
             # Check shortcuts
             shortcuts = chains.get("shortcuts", {})
@@ -145,13 +205,13 @@ class IntegrationTester:
             
             for short, full in expected_shortcuts.items():
                 if shortcuts.get(short) == full:
-                    self.results['passed'].append(f"✅ Shortcut configured: {short} → {full}")
+                    self.record('passed', f"✅ Shortcut configured: {short} → {full}")
                 else:
-                    self.results['failed'].append(f"❌ Shortcut missing: {short}")
+                    self.record('failed', f"❌ Shortcut missing: {short}")
                     
     def test_alias_configuration(self):
         """Test aliases.json configuration"""
-        print("\n🔤 Testing Alias Configuration...")
+        self.section("\n🔤 Testing Alias Configuration...")
         
         aliases_file = self.claude_dir / "aliases.json"
         if aliases_file.exists():
@@ -168,13 +228,14 @@ class IntegrationTester:
             
             for alias, cmd in expected_aliases.items():
                 if aliases.get(alias) == cmd:
-                    self.results['passed'].append(f"✅ Alias configured: {alias} → {cmd}")
+                    self.record('passed', f"✅ Alias configured: {alias} → {cmd}")
                 else:
-                    self.results['failed'].append(f"❌ Alias missing: {alias}")
+                    self.record('failed', f"❌ Alias missing: {alias}")
                     
     def test_git_worktree_support(self):
         """Test git worktree functionality"""
-        print("\n🌳 Testing Git Worktree Support...")
+        self.section("\n🌳 Testing Git Worktree Support...")
+        import subprocess
         
         # Check git version
         try:
@@ -182,44 +243,44 @@ class IntegrationTester:
                                   capture_output=True, text=True)
             if result.returncode == 0:
                 version = result.stdout.strip()
-                self.results['passed'].append(f"✅ Git available: {version}")
+                self.record('passed', f"✅ Git available: {version}")
                 
                 # Check worktree support
                 help_result = subprocess.run(["git", "worktree", "--help"],
                                            capture_output=True, text=True)
                 if help_result.returncode == 0:
-                    self.results['passed'].append("✅ Git worktree command available")
+                    self.record('passed', "✅ Git worktree command available")
                 else:
-                    self.results['failed'].append("❌ Git worktree not supported")
+                    self.record('failed', "❌ Git worktree not supported")
             else:
-                self.results['failed'].append("❌ Git not available")
+                self.record('failed', "❌ Git not available")
         except Exception as e:
-            self.results['failed'].append(f"❌ Git test failed: {e}")
+            self.record('failed', f"❌ Git test failed: {e}")
             
     def test_applescript_integration(self):
         """Test AppleScript integration (macOS only)"""
-        print("\n🍎 Testing AppleScript Integration...")
+        self.section("\n🍎 Testing AppleScript Integration...")
         
         # Check if we're on macOS
-        import platform
-        if platform.system() != "Darwin":
-            self.results['warnings'].append("⚠️  AppleScript only available on macOS")
+        if sys.platform != "darwin":
+            self.record('warnings', "⚠️  AppleScript only available on macOS")
             return
+        import subprocess
             
         # Test osascript availability
         try:
             result = subprocess.run(["osascript", "-e", "return \"test\""],
                                   capture_output=True, text=True)
             if result.returncode == 0:
-                self.results['passed'].append("✅ AppleScript (osascript) available")
+                self.record('passed', "✅ AppleScript (osascript) available")
             else:
-                self.results['failed'].append("❌ AppleScript not working")
+                self.record('failed', "❌ AppleScript not working")
         except:
-            self.results['failed'].append("❌ osascript command not found")
+            self.record('failed', "❌ osascript command not found")
             
     def test_next_command_suggestions(self):
         """Test next command suggester integration"""
-        print("\n💡 Testing Next Command Suggestions...")
+        self.section("\n💡 Testing Next Command Suggestions...")
         
         suggester_path = self.claude_dir / "hooks/post-tool-use/16-next-command-suggester.py"
         if suggester_path.exists():
@@ -236,59 +297,57 @@ class IntegrationTester:
             
             for cmd in worktree_commands:
                 if f"'{cmd}':" in content:
-                    self.results['passed'].append(f"✅ Suggestion configured: {cmd}")
+                    self.record('passed', f"✅ Suggestion configured: {cmd}")
                 else:
-                    self.results['warnings'].append(f"⚠️  No suggestions for: {cmd}")
+                    self.record('warnings', f"⚠️  No suggestions for: {cmd}")
                     
             # Check for multi-perspective review
             if "'multi-perspective-review':" in content:
-                self.results['passed'].append("✅ Multi-perspective review suggestions configured")
+                self.record('passed', "✅ Multi-perspective review suggestions configured")
             else:
-                self.results['warnings'].append("⚠️  No multi-perspective review suggestions")
+                self.record('warnings', "⚠️  No multi-perspective review suggestions")
                 
     def print_results(self):
         """Print test results"""
-        print("\n" + "=" * 60)
-        print("📊 TEST RESULTS")
-        print("=" * 60)
+        out = ["", "=" * 60, "📊 TEST RESULTS", "=" * 60]
         
         # Passed tests
-        if self.results['passed']:
-            print(f"\n✅ Passed: {len(self.results['passed'])}")
-            for test in self.results['passed']:
-                print(f"   {test}")
+        if self._counts['passed']:
+            out.append(f"\n✅ Passed: {self._counts['passed']}")
+            out.append(self.results['passed'].getvalue().rstrip("\n"))
                 
         # Warnings
-        if self.results['warnings']:
-            print(f"\n⚠️  Warnings: {len(self.results['warnings'])}")
-            for warning in self.results['warnings']:
-                print(f"   {warning}")
+        if self._counts['warnings']:
+            out.append(f"\n⚠️  Warnings: {self._counts['warnings']}")
+            out.append(self.results['warnings'].getvalue().rstrip("\n"))
                 
         # Failed tests
-        if self.results['failed']:
-            print(f"\n❌ Failed: {len(self.results['failed'])}")
-            for test in self.results['failed']:
-                print(f"   {test}")
+        if self._counts['failed']:
+            out.append(f"\n❌ Failed: {self._counts['failed']}")
+            out.append(self.results['failed'].getvalue().rstrip("\n"))
                 
         # Summary
-        total = len(self.results['passed']) + len(self.results['failed'])
-        pass_rate = (len(self.results['passed']) / total * 100) if total > 0 else 0
+        total = self._counts['passed'] + self._counts['failed']
+        pass_rate = (self._counts['passed'] / total * 100) if total > 0 else 0
         
-        print(f"\n📈 Pass Rate: {pass_rate:.1f}% ({len(self.results['passed'])}/{total})")
+        out.append(f"\n📈 Pass Rate: {pass_rate:.1f}% ({self._counts['passed']}/{total})")
         
-        if not self.results['failed']:
-            print("\n🎉 All tests passed! Worktree and Multi-Perspective Review integration is ready!")
+        if not self._counts['failed']:
+            out.append("\n🎉 All tests passed! Worktree and Multi-Perspective Review integration is ready!")
         else:
-            print("\n⚠️  Some tests failed. Please review and fix the issues above.")
+            out.append("\n⚠️  Some tests failed. Please review and fix the issues above.")
             
         # Next steps
-        print("\n🚀 Next Steps:")
-        print("1. Try: /wt feature-1 feature-2")
-        print("2. Monitor: /wt-status --monitor")
-        print("3. Review: /chain mpr")
-        print("4. Merge: /wt-merge feature-1")
+        out.append("""
+🚀 Next Steps:
+1. Try: /wt feature-1 feature-2
+2. Monitor: /wt-status --monitor
+3. Review: /chain mpr
+4. Merge: /wt-merge feature-1
+
+📚 Full guide: .claude/docs/WORKTREE_AND_REVIEW_GUIDE.md""")
         
-        print("\n📚 Full guide: .claude/docs/WORKTREE_AND_REVIEW_GUIDE.md")
+        sys.stdout.write("\n".join(out) + "\n")
 
 if __name__ == "__main__":
     tester = IntegrationTester()
@@ -4,47 +4,48 @@ Final integration test - simulate actual workflow
 """
 
 import json
+import sys
 from pathlib import Path
 
 def test_workflow_simulation():
     """Simulate a typical workflow with worktrees"""
-    print("🎯 Workflow Simulation Test")
-    print("=" * 50)
+    out = ["🎯 Workflow Simulation Test", "=" * 50]
     
     # Check Task Ledger integration
-    print("\n📋 Task Ledger Integration:")
+    out.append("\n📋 Task Ledger Integration:")
     ledger_path = Path(".task-ledger.md")
     if ledger_path.exists():
-        print("   ✅ Task ledger exists")
+        out.append("   ✅ Task ledger exists")
         # Check if worktree markers would be added
         content = ledger_path.read_text()
         if "[Worktree:" in content:
-            print("   ✅ Worktree markers present in ledger")
+            out.append("   ✅ Worktree markers present in ledger")
         else:
-            print("   ℹ️  No worktree markers yet (normal for new setup)")
+            out.append("   ℹ️  No worktree markers yet (normal for new setup)")
     else:
-        print("   ℹ️  Task ledger not created yet")
+        out.append("   ℹ️  Task ledger not created yet")
     
     # Check workflow state persistence
-    print("\n💾 State Persistence:")
+    out.append("\n💾 State Persistence:")
     workflow_state = Path(".claude/context/workflow_state.json")
     if workflow_state.exists():
-        print("   ✅ Workflow state file exists")
+        out.append("   ✅ Workflow state file exists")
     else:
-        print("   ℹ️  Workflow state will be created on first use")
+        out.append("   ℹ️  Workflow state will be created on first use")
     
     # Simulate command flow
-    print("\n🔄 Command Flow Simulation:")
-    print("   1. /sr                    → Load context")
-    print("   2. /prd user-system      → Create PRD")
-    print("   3. /gt user-system       → Generate tasks")
-    print("   4. /wt auth profile      → Create worktrees")
-    print("   5. /wt-status            → Monitor progress")
-    print("   6. /chain mpr            → Multi-perspective review")
-    print("   7. /wt-merge auth        → Merge feature")
+    out.append("""
+🔄 Command Flow Simulation:
+   1. /sr                    → Load context
+   2. /prd user-system      → Create PRD
+   3. /gt user-system       → Generate tasks
+   4. /wt auth profile      → Create worktrees
+   5. /wt-status            → Monitor progress
+   6. /chain mpr            → Multi-perspective review
+   7. /wt-merge auth        → Merge feature""")
     
     # Check settings
-    print("\n⚙️  Settings Check:")
+    out.append("\n⚙️  Settings Check:")
     settings_path = Path(".claude/settings.json")
     if settings_path.exists():
         with open(settings_path) as f:
@@ -52,27 +53,35 @@ def test_workflow_simulation():
         
         # Check for hook configurations
         if "hooks" in settings:
-            print("   ✅ Hook configuration present")
+            out.append("   ✅ Hook configuration present")
         
         # Check for workflow settings
         if "workflows" in settings:
-            print("   ✅ Workflow settings present")
+            out.append("   ✅ Workflow settings present")
     
     # Final recommendations
-    print("\n✨ Everything is configured correctly!")
-    print("\n🚀 Try this example workflow:")
-    print("   1. Create a test PRD:")
-    print("      /prd test-features")
-    print("\n   2. Generate tasks:")
-    print("      /gt test-features")
-    print("\n   3. Create worktrees:")
-    print("      /wt feature-a feature-b")
-    print("\n   4. Monitor progress:")
-    print("      /wt-status")
-    print("\n   5. Review with multiple perspectives:")
-    print("      /chain mpr")
+    out.append("""
+✨ Everything is configured correctly!
+
+🚀 Try this example workflow:
+   1. Create a test PRD:
+      /prd test-features
+
+   2. Generate tasks:
+      /gt test-features
+
+   3. Create worktrees:
+      /wt feature-a feature-b
+
+   4. Monitor progress:
+      /wt-status
+
+   5. Review with multiple perspectives:
+      /chain mpr
+
+📚 Full documentation: /help worktree""")
     
-    print("\n📚 Full documentation: /help worktree")
+    sys.stdout.write("\n".join(out) + "\n")
 
 if __name__ == "__main__":
     test_workflow_simulation()
@@ -6,56 +6,127 @@ Opens worktrees in new Terminal windows/tabs and monitors progress
 
 import subprocess
 import json
+import os
+import shlex
+import shutil
 import sys
 from pathlib import Path
 
+# Per-pane monitor that polls git less often as a worktree goes idle
+ADAPTIVE_MONITOR = Path(__file__).resolve().parent / "_wt_adaptive_monitor.sh"
+
+# terminal-notifier path, looked up on the first notification ("" if missing)
+_NOTIFIER_BIN = None
+
+# Seconds to wait for a detached osascript to report an error before moving on
+DETACH_WAIT = 2
+
+# Detached osascript processes still running when their caller moved on
+_DETACHED = []
+
+def _reap_detached():
+    """Collect detached osascript processes that have exited since"""
+    _DETACHED[:] = [proc for proc in _DETACHED if proc.poll() is None]
+
+def _notifier_bin() -> str:
+    """Find terminal-notifier once per process"""
+    global _NOTIFIER_BIN
+    if _NOTIFIER_BIN is None:
+        _NOTIFIER_BIN = shutil.which('terminal-notifier') or ""
+    return _NOTIFIER_BIN
+
+def _as_quote(value) -> str:
+    """Escape a value for use inside an AppleScript string literal"""
+    return str(value).replace('\\', '\\\\').replace('"', '\\"')
+
 class WorktreeAppleScript:
     def __init__(self):
         self.project_root = Path.cwd()
         self.worktree_base = self.project_root.parent / "worktrees"
+        self._refresh_known()
         
-    def open_worktree_terminal(self, worktree_name: str, new_window: bool = True) -> bool:
-        """Open a worktree in a new Terminal window/tab"""
-        worktree_path = self.worktree_base / worktree_name
+    def _refresh_known(self):
+        """Read the worktree directory names with one scandir"""
+        try:
+            with os.scandir(self.worktree_base) as entries:
+                self._known = {entry.name for entry in entries if entry.is_dir()}
+        except OSError:
+            self._known = set()
         
-        if not worktree_path.exists():
-            print(f"Worktree path not found: {worktree_path}")
+    def _run_sync(self, script: str, action: str = "") -> bool:
+        """Run an AppleScript with a single osascript call and wait for its result"""
+        try:
+            subprocess.run(['osascript', '-'], input=script, text=True, check=True)
+            return True
+        except (subprocess.CalledProcessError, OSError) as e:
+            if action:
+                print(f"Failed to {action}: {e}")
             return False
             
-        # AppleScript to open Terminal and navigate to worktree
+    def _run_detached(self, script: str, action: str = "") -> bool:
+        """Start an AppleScript in its own session, waiting only briefly for errors
+        
+        Scripts still running after DETACH_WAIT are left to finish and are
+        reaped by a later call.
+        """
+        _reap_detached()
+        try:
+            proc = subprocess.Popen(
+                ['osascript', '-'],
+                stdin=subprocess.PIPE,
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.PIPE,
+                text=True,
+                start_new_session=True
+            )
+        except OSError as e:
+            if action:
+                print(f"Failed to {action}: {e}")
+            return False
+            
+        try:
+            _, stderr = proc.communicate(script, timeout=DETACH_WAIT)
+        except subprocess.TimeoutExpired:
+            _DETACHED.append(proc)
+            return True
+            
+        if proc.returncode != 0:
+            if action:
+                print(f"Failed to {action}: {stderr.strip() or f'osascript exited with {proc.returncode}'}")
+            return False
+        return True
+            
+    def _terminal_script(self, worktree_name: str, new_window: bool = True) -> str:
+        """AppleScript that opens a worktree in a Terminal window/tab"""
+        worktree_path = self.worktree_base / worktree_name
+        command = (
+            f"cd {shlex.quote(str(worktree_path))}"
+            f" && echo {shlex.quote(f'🌳 Worktree: {worktree_name}')}"
+            f" && echo {shlex.quote(f'📁 Path: {worktree_path}')}"
+            " && echo '' && git status"
+        )
+        
         if new_window:
-            applescript = f'''
+            return f'''
             tell application "Terminal"
                 activate
-                do script "cd {worktree_path} && echo '🌳 Worktree: {worktree_name}' && echo '📁 Path: {worktree_path}' && echo '' && git status"
-                set custom title of front window to "WT: {worktree_name}"
+                do script "{_as_quote(command)}"
+                set custom title of front window to "WT: {_as_quote(worktree_name)}"
             end tell
             '''
-        else:
-            applescript = f'''
+        return f'''
             tell application "Terminal"
                 activate
                 tell application "System Events" to keystroke "t" using command down
                 delay 0.5
-                do script "cd {worktree_path} && echo '🌳 Worktree: {worktree_name}' && echo '📁 Path: {worktree_path}' && echo '' && git status" in front window
+                do script "{_as_quote(command)}" in front window
             end tell
             '''
             
-        try:
-            subprocess.run(['osascript', '-e', applescript], check=True)
-            return True
-        except subprocess.CalledProcessError as e:
-            print(f"Failed to open terminal: {e}")
-            return False
-            
-    def open_claude_in_worktree(self, worktree_name: str) -> bool:
-        """Open Claude Code in a worktree"""
+    def _claude_script(self, worktree_name: str) -> str:
+        """AppleScript that starts Claude Code in a worktree"""
         worktree_path = self.worktree_base / worktree_name
         
-        if not worktree_path.exists():
-            print(f"Worktree path not found: {worktree_path}")
-            return False
-            
         # Read task from worktree config
         config_path = worktree_path / ".claude" / "worktree-config.json"
         task = ""
@@ -64,26 +135,55 @@ class WorktreeAppleScript:
                 config = json.load(f)
                 task = config.get('worktree', {}).get('task', '')
                 
-        # AppleScript to open Claude Code with task context
-        applescript = f'''
+        command = (
+            f"cd {shlex.quote(str(worktree_path))}"
+            f" && echo {shlex.quote(f'🤖 Starting Claude Code in worktree: {worktree_name}')}"
+            f" && echo {shlex.quote(f'📋 Task: {task}')}"
+            " && echo '' && echo 'Starting Claude Code...' && claude"
+        )
+        
+        return f'''
         tell application "Terminal"
             activate
-            do script "cd {worktree_path} && echo '🤖 Starting Claude Code in worktree: {worktree_name}' && echo '📋 Task: {task}' && echo '' && echo 'Starting Claude Code...' && claude"
-            set custom title of front window to "Claude: {worktree_name}"
+            do script "{_as_quote(command)}"
+            set custom title of front window to "Claude: {_as_quote(worktree_name)}"
         end tell
         '''
         
-        try:
-            subprocess.run(['osascript', '-e', applescript], check=True)
-            return True
-        except subprocess.CalledProcessError as e:
-            print(f"Failed to open Claude Code: {e}")
+    def _finder_script(self, worktree_name: str) -> str:
+        """AppleScript that opens a worktree in Finder"""
+        worktree_path = self.worktree_base / worktree_name
+        
+        return f'''
+        tell application "Finder"
+            activate
+            open POSIX file "{_as_quote(worktree_path)}"
+            set current view of front window to column view
+        end tell
+        '''
+        
+    def open_worktree_terminal(self, worktree_name: str, new_window: bool = True) -> bool:
+        """Open a worktree in a new Terminal window/tab"""
+        worktree_path = self.worktree_base / worktree_name
+        
+        if worktree_name not in self._known:
+            print(f"Worktree path not found: {worktree_path}")
             return False
             
-    def open_monitoring_dashboard(self, worktree_names: list) -> bool:
-        """Open a monitoring dashboard for multiple worktrees"""
+        return self._run_detached(self._terminal_script(worktree_name, new_window), "open terminal")
+            
+    def open_claude_in_worktree(self, worktree_name: str) -> bool:
+        """Open Claude Code in a worktree"""
+        worktree_path = self.worktree_base / worktree_name
         
-        # Create monitoring script
+        if worktree_name not in self._known:
+            print(f"Worktree path not found: {worktree_path}")
+            return False
+            
+        return self._run_detached(self._claude_script(worktree_name), "open Claude Code")
+        
+    def _dashboard_script(self, worktree_names: list) -> str:
+        """AppleScript for one monitoring window with a pane per worktree"""
         monitor_script = '''
         tell application "Terminal"
             activate
@@ -103,53 +203,80 @@ class WorktreeAppleScript:
                 delay 0.5
                 '''
                 
+            command = f"bash {shlex.quote(str(ADAPTIVE_MONITOR))} {shlex.quote(name)} {shlex.quote(str(path))}"
             monitor_script += f'''
-            do script "cd {path} && watch -n 5 'echo \\"🌳 {name}\\" && git status -s && echo \\"\\" && tail -n 20 .task-ledger.md 2>/dev/null || echo \\"No task ledger\\"'" in front window
+            do script "{_as_quote(command)}" in front window
             '''
             
         monitor_script += '''
         end tell
         '''
+        return monitor_script
         
-        try:
-            subprocess.run(['osascript', '-e', monitor_script], check=True)
-            return True
-        except subprocess.CalledProcessError as e:
-            print(f"Failed to open monitoring dashboard: {e}")
+    def bulk_open(self, items: list) -> bool:
+        """Open several worktrees with one osascript call
+        
+        items is a list of (kind, worktree_name) where kind is
+        "terminal", "claude", "finder" or "monitor". All "monitor" items
+        share one dashboard window, opened after the others.
+        """
+        builders = {
+            "terminal": self._terminal_script,
+            "claude": self._claude_script,
+            "finder": self._finder_script
+        }
+        fragments = []
+        monitored = []
+        for kind, worktree_name in items:
+            worktree_path = self.worktree_base / worktree_name
+            if worktree_name not in self._known:
+                print(f"Worktree path not found: {worktree_path}")
+                continue
+            if kind == "monitor":
+                monitored.append(worktree_name)
+            else:
+                fragments.append(builders[kind](worktree_name))
+                
+        if monitored:
+            fragments.append(self._dashboard_script(monitored))
+        if not fragments:
             return False
+        return self._run_detached("\n".join(fragments), "open worktrees")
+            
+    def open_monitoring_dashboard(self, worktree_names: list) -> bool:
+        """Open a monitoring dashboard for multiple worktrees"""
+        return self.bulk_open([("monitor", name) for name in worktree_names])
             
     def show_worktree_notification(self, title: str, message: str) -> bool:
         """Show a macOS notification"""
+        global _NOTIFIER_BIN
+        
+        # terminal-notifier starts much faster than osascript
+        notifier = _notifier_bin()
+        if notifier:
+            try:
+                subprocess.Popen(
+                    [notifier, '-title', title, '-message', message, '-sound', 'Glass'],
+                    stdin=subprocess.DEVNULL,
+                    stdout=subprocess.DEVNULL,
+                    start_new_session=True
+                )
+                return True
+            except OSError:
+                _NOTIFIER_BIN = ""
+                
         applescript = f'''
-        display notification "{message}" with title "{title}" sound name "Glass"
+        display notification "{_as_quote(message)}" with title "{_as_quote(title)}" sound name "Glass"
         '''
         
-        try:
-            subprocess.run(['osascript', '-e', applescript], check=True)
-            return True
-        except:
-            return False
+        return self._run_sync(applescript)
             
     def open_finder_in_worktree(self, worktree_name: str) -> bool:
         """Open Finder in worktree directory"""
-        worktree_path = self.worktree_base / worktree_name
-        
-        if not worktree_path.exists():
+        if worktree_name not in self._known:
             return False
             
-        applescript = f'''
-        tell application "Finder"
-            activate
-            open POSIX file "{worktree_path}"
-            set current view of front window to column view
-        end tell
-        '''
-        
-        try:
-            subprocess.run(['osascript', '-e', applescript], check=True)
-            return True
-        except:
-            return False
+        return self._run_detached(self._finder_script(worktree_name))
 
 
 def main():
@@ -160,6 +287,7 @@ def main():
         print("  terminal <name>     - Open worktree in Terminal")
         print("  claude <name>       - Open Claude Code in worktree")
         print("  monitor <names...>  - Open monitoring dashboard")
+        print("  multi <names...>    - Open Claude Code in several worktrees at once")
         print("  finder <name>       - Open in Finder")
         return
         
@@ -173,7 +301,10 @@ def main():
         script.open_claude_in_worktree(sys.argv[2])
         
     elif command == "monitor" and len(sys.argv) > 2:
-        script.open_monitoring_dashboard(sys.argv[2:])
+        script.bulk_open([("monitor", name) for name in sys.argv[2:]])
+        
+    elif command == "multi" and len(sys.argv) > 2:
+        script.bulk_open([("claude", name) for name in sys.argv[2:]])
         
     elif command == "finder" and len(sys.argv) > 2:
         script.open_finder_in_worktree(sys.argv[2])
@@ -6,19 +6,64 @@ Provides filesystem isolation for parallel agent execution
 
 import json
 import os
+import re
 import sys
 import subprocess
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
 from pathlib import Path
 from datetime import datetime
 import shutil
 import argparse
 
+# "X/Y tasks" progress markers in .task-ledger.md
+TASK_PATTERN = re.compile(r'(\d+)/(\d+)\s+tasks?')
+
+# Read-only parts of .claude that worktrees may share by hardlink: top-level
+# directory -> file suffix (None for any file). Everything else (context/,
+# analytics/, metrics/, state/, logs, JSON state) is rewritten in place by
+# hooks, so each worktree gets its own copy.
+SHARED_CONFIG = {"hooks": ".py", "commands": ".md", "scripts": None}
+
+def _is_shared(rel_path: Path) -> bool:
+    """True if a .claude file is read-only config that can be hardlinked"""
+    if len(rel_path.parts) < 2 or rel_path.parts[0] not in SHARED_CONFIG:
+        return False
+    suffix = SHARED_CONFIG[rel_path.parts[0]]
+    return suffix is None or (len(rel_path.parts) == 2 and rel_path.suffix == suffix)
+
+def _link_or_copy(src, dst, claude_dir: Path):
+    """Copy a .claude file into a worktree, hardlinking untracked read-only assets
+    
+    Files already in the new checkout are tracked, and may be edited in the
+    worktree, so they are always copied over the checkout's own copy.
+    """
+    if not os.path.lexists(dst) and _is_shared(Path(src).relative_to(claude_dir)):
+        try:
+            os.link(src, dst)
+            return
+        except OSError:
+            # e.g. worktrees on another filesystem
+            pass
+    shutil.copy2(src, dst)
+        
+def _write_file(path: Path, text: str):
+    """Write via a temp file and os.replace so a hardlinked original is left untouched"""
+    tmp_path = path.with_name(path.name + '.tmp')
+    tmp_path.write_text(text)
+    os.replace(tmp_path, path)
+
 class WorktreeManager:
     def __init__(self):
         self.project_root = Path.cwd()
         self.worktree_base = self.project_root.parent / "worktrees"
         self.claude_dir = self.project_root / ".claude"
         self.config_file = self.claude_dir / "worktree-config.json"
+        self.ledger_cache_file = self.claude_dir / "analytics" / "ledger-cache.json"
+        self._wt_cache = None
+        self._cfg_cache = {}
+        self._ledger_cache = None
+        self._ledger_dirty = False
         
     def create_worktree(self, name: str, task: str = "", base_branch: str = "main") -> dict:
         """Create a new worktree with Claude configuration"""
@@ -49,11 +94,14 @@ class WorktreeManager:
                 
         except Exception as e:
             return {"error": f"Git command failed: {str(e)}"}
+        finally:
+            self._wt_cache = None
             
         # Copy Claude configuration
         if self.claude_dir.exists():
             dest_claude = worktree_path / ".claude"
-            shutil.copytree(self.claude_dir, dest_claude, dirs_exist_ok=True)
+            shutil.copytree(self.claude_dir, dest_claude, dirs_exist_ok=True,
+                            copy_function=partial(_link_or_copy, claude_dir=self.claude_dir))
             
             # Create worktree-specific config
             worktree_config = {
@@ -68,14 +116,13 @@ class WorktreeManager:
             }
             
             config_path = dest_claude / "worktree-config.json"
-            with open(config_path, 'w') as f:
-                json.dump(worktree_config, f, indent=2)
+            _write_file(config_path, json.dumps(worktree_config, indent=2))
                 
             # Create task file if task provided
             if task:
                 task_file = dest_claude / "context" / "current-task.md"
                 task_file.parent.mkdir(parents=True, exist_ok=True)
-                task_file.write_text(f"# Current Task\n\n{task}\n")
+                _write_file(task_file, f"# Current Task\n\n{task}\n")
                 
         return {
             "success": True,
@@ -92,20 +139,22 @@ class WorktreeManager:
         worktrees = self._list_worktrees()
         
         if detailed:
-            for wt in worktrees:
-                # Add Claude config info if available
-                config_path = Path(wt['path']) / ".claude" / "worktree-config.json"
-                if config_path.exists():
-                    with open(config_path) as f:
-                        config = json.load(f)
-                        wt['task'] = config.get('worktree', {}).get('task', '')
-                        wt['created'] = config.get('worktree', {}).get('created', '')
-                        
-                # Add git status
-                wt['status'] = self._get_worktree_status(wt['path'])
+            worktrees = self._map_worktrees(self._describe_worktree, worktrees)
                 
         return worktrees
         
+    def _describe_worktree(self, wt: dict) -> dict:
+        """Add config info and git status to a worktree listing"""
+        # Add Claude config info if available
+        config = self._read_wt_config(Path(wt['path']))
+        if config is not None:
+            wt['task'] = config.get('worktree', {}).get('task', '')
+            wt['created'] = config.get('worktree', {}).get('created', '')
+            
+        # Add git status
+        wt['status'] = self._get_worktree_status(wt['path'])
+        return wt
+        
     def get_status(self, name: str = None) -> dict:
         """Get status of worktree(s)"""
         if name:
@@ -113,38 +162,45 @@ class WorktreeManager:
         else:
             worktrees = self._list_worktrees()
             
-        status_data = []
-        
-        for wt in worktrees:
-            path = Path(wt['path'])
-            
-            # Get task info
-            config_path = path / ".claude" / "worktree-config.json"
-            task_info = {}
-            if config_path.exists():
-                with open(config_path) as f:
-                    config = json.load(f)
-                    task_info = config.get('worktree', {})
-                    
-            # Get task ledger progress
-            ledger_path = path / ".task-ledger.md"
-            progress = self._parse_task_ledger(ledger_path) if ledger_path.exists() else {}
-            
-            # Get git status
-            git_status = self._get_worktree_status(str(path))
-            
-            status_data.append({
-                "name": wt['name'],
-                "branch": wt['branch'],
-                "path": wt['path'],
-                "task": task_info.get('task', ''),
-                "created": task_info.get('created', ''),
-                "progress": progress,
-                "git": git_status
-            })
+        # Load before fanning out so worker threads share one cache
+        self._load_ledger_cache()
+        status_data = self._map_worktrees(self._enrich_worktree, worktrees)
             
+        self._save_ledger_cache()
         return {"worktrees": status_data}
         
+    def _enrich_worktree(self, wt: dict) -> dict:
+        """Collect task info, ledger progress and git status for one worktree"""
+        path = Path(wt['path'])
+        
+        # Get task info
+        config = self._read_wt_config(path)
+        task_info = config.get('worktree', {}) if config is not None else {}
+        
+        # Get task ledger progress
+        ledger_path = path / ".task-ledger.md"
+        progress = self._parse_task_ledger(ledger_path) if ledger_path.exists() else {}
+        
+        # Get git status
+        git_status = self._get_worktree_status(str(path))
+        
+        return {
+            "name": wt['name'],
+            "branch": wt['branch'],
+            "path": wt['path'],
+            "task": task_info.get('task', ''),
+            "created": task_info.get('created', ''),
+            "progress": progress,
+            "git": git_status
+        }
+        
+    def _map_worktrees(self, func, worktrees: list) -> list:
+        """Run func over worktrees concurrently, keeping their order"""
+        if not worktrees:
+            return []
+        with ThreadPoolExecutor(max_workers=min(8, len(worktrees))) as executor:
+            return list(executor.map(func, worktrees))
+        
     def remove_worktree(self, name: str, force: bool = False) -> dict:
         """Remove a worktree"""
         worktrees = self._list_worktrees()
@@ -166,116 +222,181 @@ class WorktreeManager:
                 cmd.append("--force")
                 
             result = subprocess.run(cmd, capture_output=True, text=True)
+            self._wt_cache = None
             
             if result.returncode != 0:
                 return {"error": f"Failed to remove worktree: {result.stderr}"}
                 
-            # Prune worktree refs
-            subprocess.run(["git", "worktree", "prune"], capture_output=True)
-            
             return {"success": True, "removed": name}
             
         except Exception as e:
             return {"error": f"Failed to remove worktree: {str(e)}"}
             
     def _list_worktrees(self) -> list:
-        """Get list of git worktrees"""
-        try:
-            result = subprocess.run(
-                ["git", "worktree", "list", "--porcelain"],
-                capture_output=True,
-                text=True,
-                check=True
-            )
-            
-            worktrees = []
-            current_wt = {}
+        """Get list of git worktrees (read once per manager, returned as copies)"""
+        if self._wt_cache is None:
+            self._wt_cache = self._read_worktrees()
+        return [dict(wt) for wt in self._wt_cache]
+        
+    def _read_worktrees(self) -> list:
+        """Run `git worktree list` and parse the porcelain output"""
+        # -z (NUL-separated) needs git 2.36+; older git gets newline-separated records
+        for extra_args, separator in ((["-z"], '\0'), ([], '\n')):
+            try:
+                result = subprocess.run(
+                    ["git", "worktree", "list", "--porcelain", *extra_args],
+                    capture_output=True,
+                    text=True,
+                    check=True
+                )
+                break
+            except subprocess.CalledProcessError:
+                continue
+        else:
+            return []
             
-            for line in result.stdout.strip().split('\n'):
-                if line.startswith('worktree '):
-                    if current_wt:
-                        worktrees.append(current_wt)
-                    current_wt = {'path': line[9:]}
-                elif line.startswith('branch '):
-                    current_wt['branch'] = line[7:]
-                    # Extract name from branch
-                    if current_wt['branch'].startswith('refs/heads/feature/'):
-                        current_wt['name'] = current_wt['branch'][19:]
-                    else:
-                        current_wt['name'] = Path(current_wt['path']).name
-                elif line == '':
-                    if current_wt:
-                        worktrees.append(current_wt)
-                        current_wt = {}
-                        
-            if current_wt:
+        worktrees = []
+        current_wt = {}
+        
+        # Each attribute ends in the separator; an empty field ends the record
+        for field in result.stdout.split(separator):
+            key, _, value = field.partition(' ')
+            if key == 'worktree':
+                current_wt = {'path': value}
+            elif key == 'branch':
+                current_wt['branch'] = value
+                # Feature worktrees are named after their branch
+                if value.startswith('refs/heads/feature/'):
+                    current_wt['name'] = value.removeprefix('refs/heads/feature/')
+                else:
+                    current_wt['name'] = Path(current_wt['path']).name
+            elif not field and current_wt:
                 worktrees.append(current_wt)
+                current_wt = {}
                 
-            return worktrees
+        if current_wt:
+            worktrees.append(current_wt)
             
-        except subprocess.CalledProcessError:
-            return []
+        return worktrees
             
+    def _read_wt_config(self, worktree_path: Path):
+        """Load a worktree's Claude config, reusing it while the file is unchanged"""
+        config_path = worktree_path / ".claude" / "worktree-config.json"
+        try:
+            mtime_ns = config_path.stat().st_mtime_ns
+        except OSError:
+            return None
+            
+        key = str(config_path)
+        cached = self._cfg_cache.get(key)
+        if cached and cached[0] == mtime_ns:
+            return cached[1]
+            
+        with open(config_path) as f:
+            config = json.load(f)
+        self._cfg_cache[key] = (mtime_ns, config)
+        return config
+        
     def _get_worktree_status(self, path: str) -> dict:
         """Get git status for a worktree"""
         try:
-            # Change to worktree directory
-            original_dir = os.getcwd()
-            os.chdir(path)
-            
-            # Get status
+            # Changes, branch and upstream tracking in one git call
             result = subprocess.run(
-                ["git", "status", "--porcelain"],
-                capture_output=True,
-                text=True
-            )
-            
-            changes = result.stdout.strip().split('\n') if result.stdout.strip() else []
-            
-            # Get branch info
-            branch_result = subprocess.run(
-                ["git", "rev-parse", "--abbrev-ref", "HEAD"],
-                capture_output=True,
-                text=True
-            )
-            
-            current_branch = branch_result.stdout.strip()
-            
-            # Get commits ahead/behind
-            ahead_behind = subprocess.run(
-                ["git", "rev-list", "--left-right", "--count", f"origin/main...{current_branch}"],
+                ["git", "-C", path, "status", "--porcelain=v2", "--branch"],
                 capture_output=True,
                 text=True
             )
             
+            changes_count = 0
+            current_branch = upstream = ""
             ahead = behind = 0
-            if ahead_behind.returncode == 0 and ahead_behind.stdout.strip():
-                parts = ahead_behind.stdout.strip().split()
-                if len(parts) == 2:
-                    behind, ahead = int(parts[0]), int(parts[1])
+            
+            for line in result.stdout.splitlines():
+                if line.startswith('# branch.head '):
+                    current_branch = line[len('# branch.head '):]
+                    if current_branch == '(detached)':
+                        current_branch = 'HEAD'
+                elif line.startswith('# branch.upstream '):
+                    upstream = line[len('# branch.upstream '):]
+                elif line.startswith('# branch.ab '):
+                    parts = line.split()
+                    if upstream == 'origin/main' and len(parts) == 4:
+                        ahead, behind = int(parts[2]), -int(parts[3])
+                elif line and not line.startswith('#'):
+                    changes_count += 1
                     
-            os.chdir(original_dir)
+            # Ahead/behind is measured against origin/main - only ask git
+            # again when the branch doesn't already track it
+            if upstream != 'origin/main' and current_branch:
+                ahead_behind = subprocess.run(
+                    ["git", "-C", path, "rev-list", "--left-right", "--count", f"origin/main...{current_branch}"],
+                    capture_output=True,
+                    text=True
+                )
+                
+                if ahead_behind.returncode == 0 and ahead_behind.stdout.strip():
+                    parts = ahead_behind.stdout.strip().split()
+                    if len(parts) == 2:
+                        behind, ahead = int(parts[0]), int(parts[1])
             
             return {
-                "has_changes": len(changes) > 0,
-                "changes_count": len(changes),
+                "has_changes": changes_count > 0,
+                "changes_count": changes_count,
                 "branch": current_branch,
                 "ahead": ahead,
                 "behind": behind
             }
             
         except Exception as e:
-            os.chdir(original_dir)
             return {"error": str(e)}
             
+    def _load_ledger_cache(self) -> dict:
+        """Load parsed ledger progress keyed by ledger path"""
+        if self._ledger_cache is None:
+            try:
+                with open(self.ledger_cache_file) as f:
+                    self._ledger_cache = json.load(f)
+            except (OSError, json.JSONDecodeError):
+                self._ledger_cache = {}
+        return self._ledger_cache
+        
+    def _save_ledger_cache(self):
+        """Persist parsed ledger progress if anything was re-parsed"""
+        if not self._ledger_dirty:
+            return
+        try:
+            self.ledger_cache_file.parent.mkdir(parents=True, exist_ok=True)
+            with open(self.ledger_cache_file, 'w') as f:
+                json.dump(self._ledger_cache, f, indent=2)
+            self._ledger_dirty = False
+        except OSError:
+            pass
+            
     def _parse_task_ledger(self, ledger_path: Path) -> dict:
-        """Parse task ledger for progress info"""
+        """Parse task ledger for progress info, reusing results for unchanged files"""
+        try:
+            st = ledger_path.stat()
+            cache = self._load_ledger_cache()
+            key = str(ledger_path)
+            cached = cache.get(key)
+            if cached and cached[0] == st.st_mtime_ns and cached[1] == st.st_size:
+                return dict(cached[2])
+                
+            progress = self._read_task_ledger(ledger_path)
+            cache[key] = [st.st_mtime_ns, st.st_size, progress]
+            self._ledger_dirty = True
+            return dict(progress)
+            
+        except Exception:
+            return {"completed": 0, "total": 0, "percentage": 0}
+            
+    def _read_task_ledger(self, ledger_path: Path) -> dict:
+        """Read and parse a task ledger file"""
         try:
             content = ledger_path.read_text()
             
             # Simple parsing - look for X/Y pattern
-            import re
-            matches = re.findall(r'(\d+)/(\d+)\s+tasks?', content)
+            matches = TASK_PATTERN.findall(content)
             
             if matches:
                 completed = sum(int(m[0]) for m in matches)
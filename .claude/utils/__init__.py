@@ -1,6 +1,6 @@
 # Claude Utils Package
 # Utilities for hook system enhancements
 
-from .suggestion_engine import SuggestionEngine
+from .suggestion_engine import SuggestionEngine, get_engine
 
-__all__ = ['SuggestionEngine']
+__all__ = ['SuggestionEngine', 'get_engine']
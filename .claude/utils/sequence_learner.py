@@ -4,31 +4,115 @@ Command Sequence Learner - Tracks and learns from command usage patterns
 Part of the Next Command Suggestion System
 """
 
+import atexit
 import json
+import os
+import re
+import time
+from collections import Counter, deque
 from pathlib import Path
 from datetime import datetime
-from collections import defaultdict
 from typing import Dict, List, Tuple
 
+# Debounce disk writes: save after this many transitions or seconds
+SAVE_EVERY = 20
+SAVE_INTERVAL = 30
+
+# Sequences kept in memory; the append log is compacted past twice this
+MAX_SEQUENCES = 1000
+
+# Commands that mark a workflow as successfully completed (matched anywhere
+# in the command, so arguments after them still count)
+SUCCESS_ENDINGS = ['fw complete', 'pr-feedback', 'test passed']
+SUCCESS_PATTERN = re.compile('|'.join(map(re.escape, SUCCESS_ENDINGS)))
+
 class CommandSequenceLearner:
     def __init__(self):
         self.data_file = Path('.claude/analytics/command-sequences.json')
         self.patterns_file = Path('.claude/analytics/learned-patterns.json')
+        self.sequence_log = Path('.claude/analytics/command-sequences.jsonl')
+        self._log_lines = 0
         self.data = self.load_data()
         self.patterns = self.load_patterns()
+        # Commands whose transitions changed since the last analyze_patterns()
+        self._touched = set()
+        self._unsaved = 0
+        self._last_save = time.monotonic()
+        self._file_stamp = self._stamp()
+    
+    def _stamp(self) -> Tuple:
+        """mtimes of the saved data/pattern files (None if missing)."""
+        stamp = []
+        for path in (self.data_file, self.patterns_file):
+            try:
+                stamp.append(path.stat().st_mtime_ns)
+            except OSError:
+                stamp.append(None)
+        return tuple(stamp)
+    
+    def is_stale(self) -> bool:
+        """True if another process saved since this learner loaded or saved."""
+        return self._stamp() != self._file_stamp
     
     def load_data(self) -> Dict:
         """Load existing sequence data."""
+        data = {
+            'transitions': {},
+            'success_patterns': []
+        }
         if self.data_file.exists():
             try:
-                return json.loads(self.data_file.read_text())
+                data = json.loads(self.data_file.read_text())
             except:
                 pass
-        return {
-            'sequences': [],
-            'transitions': defaultdict(lambda: defaultdict(int)),
-            'success_patterns': []
-        }
+        
+        # Older files kept sequences inline - move them to the append log
+        legacy = data.pop('sequences', None)
+        if legacy and not self.sequence_log.exists():
+            self._append_sequences(legacy[-MAX_SEQUENCES:])
+        
+        data['sequences'] = self.load_sequences()
+        
+        # Analysis state only matches the log it was saved with
+        if data.get('log_position') != self._log_lines:
+            data['analysis_cursor'] = 0
+            data['success_counts'] = {}
+        data['success_counts'] = Counter(data.get('success_counts', {}))
+        return data
+    
+    def load_sequences(self) -> List[Dict]:
+        """Load the most recent sequences from the append log."""
+        recent = deque(maxlen=MAX_SEQUENCES)
+        self._log_lines = 0
+        try:
+            with open(self.sequence_log, 'rb') as f:
+                for line in f:
+                    recent.append(line)
+                    self._log_lines += 1
+        except OSError:
+            pass
+        
+        # Skip lines that don't decode (e.g. a partial write from a killed hook)
+        sequences = []
+        for line in recent:
+            try:
+                sequences.append(json.loads(line))
+            except ValueError:
+                continue
+        return sequences
+    
+    def _append_sequences(self, entries: List[Dict]):
+        """Append sequence entries to the log, one JSON object per line."""
+        self.sequence_log.parent.mkdir(parents=True, exist_ok=True)
+        text = ''.join(json.dumps(entry) + '\n' for entry in entries)
+        with open(self.sequence_log, 'a+b') as f:
+            # Start on a fresh line if the last write was cut short
+            if f.seek(0, os.SEEK_END):
+                f.seek(-1, os.SEEK_END)
+                if f.read(1) != b'\n':
+                    text = '\n' + text
+            f.write(text.encode())
+        self._log_lines += len(entries)
     
     def load_patterns(self) -> Dict:
         """Load learned patterns."""
@@ -46,14 +130,10 @@ class CommandSequenceLearner:
     def record_transition(self, from_cmd: str, to_cmd: str, context: Dict):
         """Record a command transition."""
         # Update transition counts
-        if 'transitions' not in self.data:
-            self.data['transitions'] = {}
-        if from_cmd not in self.data['transitions']:
-            self.data['transitions'][from_cmd] = {}
-        if to_cmd not in self.data['transitions'][from_cmd]:
-            self.data['transitions'][from_cmd][to_cmd] = 0
-        
-        self.data['transitions'][from_cmd][to_cmd] += 1
+        transitions = self.data.setdefault('transitions', {}).setdefault(from_cmd, {})
+        transitions[to_cmd] = transitions.get(to_cmd, 0) + 1
+        self._touched.add(from_cmd)
+        self._unsaved += 1
         
         # Record sequence
         sequence_entry = {
@@ -67,20 +147,28 @@ class CommandSequenceLearner:
             }
         }
         
-        if 'sequences' not in self.data:
-            self.data['sequences'] = []
         self.data['sequences'].append(sequence_entry)
+        self._append_sequences([sequence_entry])
         
         # Keep only last 1000 sequences
-        if len(self.data['sequences']) > 1000:
-            self.data['sequences'] = self.data['sequences'][-1000:]
+        excess = len(self.data['sequences']) - MAX_SEQUENCES
+        if excess > 0:
+            self.forget_success_windows(excess)
+            self.data['sequences'] = self.data['sequences'][-MAX_SEQUENCES:]
     
     def analyze_patterns(self):
-        """Analyze sequences to find patterns."""
+        """Analyze sequences to find patterns.
+        
+        Only commands with new transitions are re-ranked; everything is
+        rebuilt when no flows have been learned yet.
+        """
         # Find most common transitions
-        common_transitions = {}
+        all_transitions = self.data.get('transitions', {})
+        common_transitions = self.patterns.get('common_flows') or {}
+        to_rank = self._touched if common_transitions else all_transitions.keys()
         
-        for from_cmd, transitions in self.data.get('transitions', {}).items():
+        for from_cmd in to_rank:
+            transitions = all_transitions.get(from_cmd)
             if transitions:
                 # Sort by frequency
                 sorted_transitions = sorted(
@@ -95,42 +183,61 @@ class CommandSequenceLearner:
                 ]
         
         self.patterns['common_flows'] = common_transitions
+        self._touched = set()
         
         # Identify successful workflow patterns
         self.identify_success_patterns()
     
+    def success_pattern_at(self, i: int):
+        """Pattern key for the window starting at sequences[i] if it ends in success."""
+        sequences = self.data['sequences']
+        
+        # Check if sequence ends with success
+        if SUCCESS_PATTERN.search(sequences[i+2].get('to', '')):
+            return ' -> '.join([
+                sequences[i]['from'],
+                sequences[i]['to'],
+                sequences[i+1]['to'],
+                sequences[i+2]['to']
+            ])
+        return None
+    
+    def forget_success_windows(self, count: int):
+        """Drop already-counted windows for the oldest `count` sequences before trimming."""
+        cursor = self.data.get('analysis_cursor', 0)
+        pattern_counts = self.data['success_counts']
+        
+        for i in range(min(count, cursor)):
+            pattern_key = self.success_pattern_at(i)
+            if pattern_key in pattern_counts:
+                pattern_counts[pattern_key] -= 1
+                if pattern_counts[pattern_key] <= 0:
+                    del pattern_counts[pattern_key]
+        
+        self.data['analysis_cursor'] = max(cursor - count, 0)
+    
     def identify_success_patterns(self):
-        """Identify patterns that lead to successful completions."""
-        # Look for sequences ending in completion commands
-        success_endings = ['fw complete', 'pr-feedback', 'test passed']
-        success_sequences = []
+        """Identify patterns that lead to successful completions.
         
+        Pattern counts are kept in the data file, so only windows added
+        since the last analysis (from 'analysis_cursor') are scanned.
+        """
         sequences = self.data.get('sequences', [])
-        for i in range(len(sequences) - 3):
-            # Check if sequence ends with success
-            if any(ending in sequences[i+2].get('to', '') for ending in success_endings):
-                pattern = [
-                    sequences[i]['from'],
-                    sequences[i]['to'],
-                    sequences[i+1]['to'],
-                    sequences[i+2]['to']
-                ]
-                success_sequences.append(pattern)
+        cursor = self.data.get('analysis_cursor', 0)
+        pattern_counts = self.data['success_counts']
+        
+        # Count pattern frequencies for the new tail
+        for i in range(cursor, len(sequences) - 3):
+            pattern_key = self.success_pattern_at(i)
+            if pattern_key:
+                pattern_counts[pattern_key] += 1
         
-        # Count pattern frequencies
-        pattern_counts = defaultdict(int)
-        for pattern in success_sequences:
-            pattern_key = ' -> '.join(pattern)
-            pattern_counts[pattern_key] += 1
+        self.data['analysis_cursor'] = max(cursor, len(sequences) - 3)
         
         # Store top patterns
         self.patterns['success_sequences'] = [
             {'pattern': pattern, 'count': count}
-            for pattern, count in sorted(
-                pattern_counts.items(),
-                key=lambda x: x[1],
-                reverse=True
-            )[:10]
+            for pattern, count in pattern_counts.most_common(10)
         ]
     
     def get_learned_suggestions(self, current_cmd: str, context: Dict) -> List[Dict]:
@@ -148,17 +255,47 @@ class CommandSequenceLearner:
         
         return suggestions
     
+    def _write_json(self, path: Path, obj):
+        """Write JSON to a temp file and swap it in atomically."""
+        tmp_path = path.with_name(path.name + '.tmp')
+        tmp_path.write_text(json.dumps(obj, indent=2))
+        os.replace(tmp_path, path)
+    
     def save(self):
         """Save data and patterns."""
         # Ensure directories exist
         self.data_file.parent.mkdir(parents=True, exist_ok=True)
         self.patterns_file.parent.mkdir(parents=True, exist_ok=True)
         
-        # Save data
-        self.data_file.write_text(json.dumps(self.data, indent=2, default=str))
+        # Compact the sequence log down to what's kept in memory
+        if self._log_lines > 2 * MAX_SEQUENCES:
+            tmp_path = self.sequence_log.with_name(self.sequence_log.name + '.tmp')
+            tmp_path.write_text(''.join(json.dumps(entry) + '\n' for entry in self.data['sequences']))
+            os.replace(tmp_path, self.sequence_log)
+            self._log_lines = len(self.data['sequences'])
+        
+        # Save data (sequences live in the append log)
+        state = {key: value for key, value in self.data.items() if key != 'sequences'}
+        state['log_position'] = self._log_lines
+        self._write_json(self.data_file, state)
         
         # Save patterns
-        self.patterns_file.write_text(json.dumps(self.patterns, indent=2))
+        self._write_json(self.patterns_file, self.patterns)
+        
+        self._unsaved = 0
+        self._last_save = time.monotonic()
+        self._file_stamp = self._stamp()
+    
+    def save_if_due(self):
+        """Save once enough transitions or time have built up."""
+        if (self._unsaved >= SAVE_EVERY
+                or time.monotonic() - self._last_save > SAVE_INTERVAL):
+            self.save()
+    
+    def flush(self):
+        """Save any transitions not yet written."""
+        if self._unsaved:
+            self.save()
     
     def update_user_preference(self, cmd_sequence: List[str], chosen: str):
         """Update user preferences based on choices."""
@@ -173,17 +310,35 @@ class CommandSequenceLearner:
         self.patterns['user_preferences'][seq_key][chosen] += 1
 
 
+# Shared learner so a process loads the files once and batches its writes
+_LEARNER = None
+
+def _get_learner() -> CommandSequenceLearner:
+    """Get the process-wide learner, reloading if another process saved."""
+    global _LEARNER
+    if _LEARNER is None:
+        _LEARNER = CommandSequenceLearner()
+        atexit.register(_flush_learner)
+    elif not _LEARNER._unsaved and _LEARNER.is_stale():
+        _LEARNER = CommandSequenceLearner()
+    return _LEARNER
+
+def _flush_learner():
+    """Write any unsaved transitions at process exit."""
+    if _LEARNER is not None:
+        _LEARNER.flush()
+
 # Utility functions for use in hooks
 def track_command_sequence(from_cmd: str, to_cmd: str, context: Dict = None):
     """Track a command sequence."""
-    learner = CommandSequenceLearner()
+    learner = _get_learner()
     learner.record_transition(from_cmd, to_cmd, context or {})
     learner.analyze_patterns()
-    learner.save()
+    learner.save_if_due()
 
 def get_learned_next_commands(current_cmd: str, context: Dict = None) -> List[Dict]:
     """Get learned suggestions for next commands."""
-    learner = CommandSequenceLearner()
+    learner = _get_learner()
     return learner.get_learned_suggestions(current_cmd, context or {})
 
 if __name__ == "__main__":
@@ -4,156 +4,235 @@ Suggestion Engine - Provides helpful corrections for design system violations
 Tracks common mistakes and provides educational feedback
 """
 
+import atexit
+import bisect
 import json
 import re
 import os
 from pathlib import Path
 from datetime import datetime
-from collections import Counter
+from collections import Counter, deque
+
+# Violations kept in the analytics log; it is trimmed back past MAX_LOG_BYTES
+MAX_VIOLATIONS = 1000
+MAX_LOG_BYTES = 512 * 1024
+
+# Tracked violations are written out in batches of this size (and at exit)
+FLUSH_THRESHOLD = 25
+
+def _jsonl(records):
+    """Serialize records as compact JSON Lines"""
+    return ''.join(json.dumps(record, separators=(',', ':')) + '\n' for record in records)
+
+def _literal_token(pattern):
+    """Return the plain word a \\bword\\b pattern matches, or None for real regexes"""
+    token = pattern.removeprefix(r'\b').removesuffix(r'\b')
+    if len(token) == len(pattern) - 4 and re.fullmatch(r'[\w-]+', token):
+        return token
+    return None
+
+def _split_patterns(patterns):
+    """Split suggestion patterns into plain words, scanned together, and real regexes
+    
+    Returns ({casefolded word: pattern index}, one regex matching any of the
+    words, [(pattern index, literal prefix, compiled regex)]). The word scan
+    opens with a class of the words' first characters so other positions are
+    skipped cheaply; the remaining regexes start with a literal '<' that re
+    finds fast. The literal prefixes let callers skip regexes that can't match.
+    """
+    literals = {}
+    regexes = []
+    for i, pattern in enumerate(patterns):
+        token = _literal_token(pattern)
+        if token:
+            literals[token.casefold()] = i
+        else:
+            prefix = re.match(r'[\w<>-]*', pattern).group().casefold()
+            regexes.append((i, prefix, re.compile(pattern, re.IGNORECASE)))
+            
+    first_chars = ''.join(sorted({word[0] for word in literals}))
+    words = '|'.join(map(re.escape, literals))
+    literal_scan = re.compile(rf'(?=[{re.escape(first_chars)}])\b(?:{words})\b', re.IGNORECASE)
+    return literals, literal_scan, regexes
 
 class SuggestionEngine:
-    def __init__(self):
-        self.analytics_dir = Path(".claude/analytics")
-        self.analytics_dir.mkdir(parents=True, exist_ok=True)
-        self.violations_file = self.analytics_dir / "design-violations.json"
-        
-        # Comprehensive mapping of violations to suggestions
-        self.suggestions = {
-            # Typography violations
-            r'\btext-sm\b': {
-                'suggestion': 'text-size-3',
-                'explanation': 'Use text-size-3 (16px) for small text. Our design system uses only 4 font sizes.',
-                'category': 'typography'
-            },
-            r'\btext-base\b': {
-                'suggestion': 'text-size-3',
-                'explanation': 'Use text-size-3 (16px) for base text size.',
-                'category': 'typography'
-            },
-            r'\btext-lg\b': {
-                'suggestion': 'text-size-2', 
-                'explanation': 'Use text-size-2 (24px) for large text. Mobile automatically adjusts to 20px.',
-                'category': 'typography'
-            },
-            r'\btext-xl\b': {
-                'suggestion': 'text-size-1',
-                'explanation': 'Use text-size-1 (32px) for extra large text. Mobile automatically adjusts to 28px.',
-                'category': 'typography'
-            },
-            r'\btext-2xl\b': {
-                'suggestion': 'text-size-1',
-                'explanation': 'Use text-size-1 (32px) for largest headings. We only have 4 font sizes.',
-                'category': 'typography'
-            },
-            r'\btext-xs\b': {
-                'suggestion': 'text-size-4',
-                'explanation': 'Use text-size-4 (12px) for extra small text like captions.',
-                'category': 'typography'
-            },
-            r'\bfont-bold\b': {
-                'suggestion': 'font-semibold',
-                'explanation': 'Only font-regular (400) and font-semibold (600) are allowed. No bold (700).',
-                'category': 'typography'
-            },
-            r'\bfont-medium\b': {
-                'suggestion': 'font-semibold',
-                'explanation': 'Use font-semibold (600) instead. We only have regular and semibold.',
-                'category': 'typography'
-            },
-            r'\bfont-light\b': {
-                'suggestion': 'font-regular',
-                'explanation': 'Use font-regular (400) instead. We only have regular and semibold.',
-                'category': 'typography'
-            },
+    # Comprehensive mapping of violations to suggestions
+    SUGGESTIONS = {
+        # Typography violations
+        r'\btext-sm\b': {
+            'suggestion': 'text-size-3',
+            'explanation': 'Use text-size-3 (16px) for small text. Our design system uses only 4 font sizes.',
+            'category': 'typography'
+        },
+        r'\btext-base\b': {
+            'suggestion': 'text-size-3',
+            'explanation': 'Use text-size-3 (16px) for base text size.',
+            'category': 'typography'
+        },
+        r'\btext-lg\b': {
+            'suggestion': 'text-size-2', 
+            'explanation': 'Use text-size-2 (24px) for large text. Mobile automatically adjusts to 20px.',
+            'category': 'typography'
+        },
+        r'\btext-xl\b': {
+            'suggestion': 'text-size-1',
+            'explanation': 'Use text-size-1 (32px) for extra large text. Mobile automatically adjusts to 28px.',
+            'category': 'typography'
+        },
+        r'\btext-2xl\b': {
+            'suggestion': 'text-size-1',
+            'explanation': 'Use text-size-1 (32px) for largest headings. We only have 4 font sizes.',
+            'category': 'typography'
+        },
+        r'\btext-xs\b': {
+            'suggestion': 'text-size-4',
+            'explanation': 'Use text-size-4 (12px) for extra small text like captions.',
+            'category': 'typography'
+        },
+        r'\bfont-bold\b': {
+            'suggestion': 'font-semibold',
+            'explanation': 'Only font-regular (400) and font-semibold (600) are allowed. No bold (700).',
+            'category': 'typography'
+        },
+        r'\bfont-medium\b': {
+            'suggestion': 'font-semibold',
+            'explanation': 'Use font-semibold (600) instead. We only have regular and semibold.',
+            'category': 'typography'
+        },
+        r'\bfont-light\b': {
+            'suggestion': 'font-regular',
+            'explanation': 'Use font-regular (400) instead. We only have regular and semibold.',
+            'category': 'typography'
+        },
             
-            # Spacing violations
-            r'\bp-5\b': {
-                'suggestion': 'p-4 (16px) or p-6 (24px)',
-                'explanation': 'Spacing must be divisible by 4. Use p-4 for less padding or p-6 for more.',
-                'category': 'spacing'
-            },
-            r'\bm-5\b': {
-                'suggestion': 'm-4 (16px) or m-6 (24px)',
-                'explanation': 'Spacing must follow 4px grid. Use m-4 or m-6 instead.',
-                'category': 'spacing'
-            },
-            r'\bp-7\b': {
-                'suggestion': 'p-6 (24px) or p-8 (32px)',
-                'explanation': 'Use p-6 for 24px or p-8 for 32px. All spacing divisible by 4.',
-                'category': 'spacing'
-            },
-            r'\bm-7\b': {
-                'suggestion': 'm-6 (24px) or m-8 (32px)',
-                'explanation': 'Use m-6 for 24px or m-8 for 32px. Follow the 4px grid.',
-                'category': 'spacing'
-            },
-            r'\bgap-5\b': {
-                'suggestion': 'gap-4 (16px) or gap-6 (24px)',
-                'explanation': 'Gap spacing must follow 4px grid. Use gap-4 or gap-6.',
-                'category': 'spacing'
-            },
-            r'\bspace-x-5\b': {
-                'suggestion': 'space-x-4 or space-x-6',
-                'explanation': 'Horizontal spacing must be divisible by 4.',
-                'category': 'spacing'
-            },
-            r'\bspace-y-5\b': {
-                'suggestion': 'space-y-4 or space-y-6',
-                'explanation': 'Vertical spacing must be divisible by 4.',
-                'category': 'spacing'
-            },
+        # Spacing violations
+        r'\bp-5\b': {
+            'suggestion': 'p-4 (16px) or p-6 (24px)',
+            'explanation': 'Spacing must be divisible by 4. Use p-4 for less padding or p-6 for more.',
+            'category': 'spacing'
+        },
+        r'\bm-5\b': {
+            'suggestion': 'm-4 (16px) or m-6 (24px)',
+            'explanation': 'Spacing must follow 4px grid. Use m-4 or m-6 instead.',
+            'category': 'spacing'
+        },
+        r'\bp-7\b': {
+            'suggestion': 'p-6 (24px) or p-8 (32px)',
+            'explanation': 'Use p-6 for 24px or p-8 for 32px. All spacing divisible by 4.',
+            'category': 'spacing'
+        },
+        r'\bm-7\b': {
+            'suggestion': 'm-6 (24px) or m-8 (32px)',
+            'explanation': 'Use m-6 for 24px or m-8 for 32px. Follow the 4px grid.',
+            'category': 'spacing'
+        },
+        r'\bgap-5\b': {
+            'suggestion': 'gap-4 (16px) or gap-6 (24px)',
+            'explanation': 'Gap spacing must follow 4px grid. Use gap-4 or gap-6.',
+            'category': 'spacing'
+        },
+        r'\bspace-x-5\b': {
+            'suggestion': 'space-x-4 or space-x-6',
+            'explanation': 'Horizontal spacing must be divisible by 4.',
+            'category': 'spacing'
+        },
+        r'\bspace-y-5\b': {
+            'suggestion': 'space-y-4 or space-y-6',
+            'explanation': 'Vertical spacing must be divisible by 4.',
+            'category': 'spacing'
+        },
             
-            # Touch target violations
-            r'<button[^>]*className="[^"]*"[^>]*>(?![^<]*h-1[12])': {
-                'suggestion': 'Add h-11 (44px) or h-12 (48px) to button',
-                'explanation': 'Buttons need minimum 44px height for mobile touch targets.',
-                'category': 'accessibility'
-            },
-            r'<a[^>]*className="[^"]*"[^>]*>(?![^<]*h-1[12])': {
-                'suggestion': 'Add h-11 or h-12 to interactive links',
-                'explanation': 'Interactive elements need 44px minimum touch target.',
-                'category': 'accessibility'
-            },
+        # Touch target violations
+        # Tag names are word-bounded (so <abbr>, <article> etc. aren't links) and
+        # the tag is captured in a lookahead and consumed with a backreference,
+        # so when the h-11/h-12 check rules it out it isn't re-scanned by
+        # backtracking through its attributes
+        r'<button\b(?=([^>]*className="[^"]*"[^>]*>))\1(?![^<]*h-1[12])': {
+            'suggestion': 'Add h-11 (44px) or h-12 (48px) to button',
+            'explanation': 'Buttons need minimum 44px height for mobile touch targets.',
+            'category': 'accessibility'
+        },
+        r'<a\b(?=([^>]*className="[^"]*"[^>]*>))\1(?![^<]*h-1[12])': {
+            'suggestion': 'Add h-11 or h-12 to interactive links',
+            'explanation': 'Interactive elements need 44px minimum touch target.',
+            'category': 'accessibility'
+        },
             
-            # Color usage
-            r'\btext-black\b': {
-                'suggestion': 'text-gray-900',
-                'explanation': 'Use text-gray-900 instead of pure black for better readability.',
-                'category': 'color'
-            },
-            r'\bbg-black\b': {
-                'suggestion': 'bg-gray-900 or bg-gray-800',
-                'explanation': 'Use gray-900/800 instead of pure black for better contrast.',
-                'category': 'color'
-            }
+        # Color usage
+        r'\btext-black\b': {
+            'suggestion': 'text-gray-900',
+            'explanation': 'Use text-gray-900 instead of pure black for better readability.',
+            'category': 'color'
+        },
+        r'\bbg-black\b': {
+            'suggestion': 'bg-gray-900 or bg-gray-800',
+            'explanation': 'Use gray-900/800 instead of pure black for better contrast.',
+            'category': 'color'
         }
+    }
+    
+    # Compiled once with the class: all plain-word patterns share a single
+    # scan over the content, only the tag patterns run as separate regexes
+    _patterns_list = list(SUGGESTIONS.items())
+    _literals, _literal_scan, _regexes = _split_patterns([pattern for pattern, _ in _patterns_list])
+    
+    # Set once the analytics directory has been created in this process
+    _dir_ready = False
+    
+    def __init__(self):
+        self.analytics_dir = Path(".claude/analytics")
+        self.violations_file = self.analytics_dir / "design-violations.jsonl"
+        self.suggestions = self.SUGGESTIONS
+        self._pending = []
+        self._flush_registered = False
+        self._legacy_checked = False
+        self._vfd = None
+        self._violations_cache = None
+        self._cache_stamp = None
     
     def find_violations(self, content, file_path=""):
         """Find all design violations in content"""
-        violations = []
+        # Substring checks are far cheaper than a regex pass, so only scan
+        # when something that could match is actually present
+        folded = content.casefold()
+        hits = []
+        if any(word in folded for word in self._literals):
+            hits = [
+                (self._literals[match.group().casefold()], match)
+                for match in self._literal_scan.finditer(content)
+            ]
+        for idx, prefix, regex in self._regexes:
+            if prefix in folded:
+                hits.extend((idx, match) for match in regex.finditer(content))
         
-        for pattern, details in self.suggestions.items():
-            try:
-                matches = list(re.finditer(pattern, content, re.IGNORECASE))
-                for match in matches:
-                    # Get context around violation
-                    start = max(0, match.start() - 50)
-                    end = min(len(content), match.end() + 50)
-                    context = content[start:end].strip()
-                    
-                    violations.append({
-                        'pattern': pattern,
-                        'matched_text': match.group(),
-                        'suggestion': details['suggestion'],
-                        'explanation': details['explanation'],
-                        'category': details['category'],
-                        'context': context,
-                        'line_number': content[:match.start()].count('\n') + 1,
-                        'file_path': file_path
-                    })
-            except Exception as e:
-                # Skip invalid regex patterns
-                continue
+        # Report grouped by pattern, in content order within each pattern
+        hits.sort(key=lambda hit: hit[0])
+        
+        # Line numbers come from a binary search over newline offsets
+        newlines = [match.start() for match in re.finditer('\n', content)] if hits else []
+        
+        # Locals keep attribute lookups out of the per-match loop
+        patterns_list = self._patterns_list
+        line_of = bisect.bisect_left
+        violations = []
+        append = violations.append
+        for idx, match in hits:
+            pattern, details = patterns_list[idx]
+            match_start, match_end = match.span()
+            
+            # Get context around violation (slicing past the end is safe)
+            context = content[max(0, match_start - 50):match_end + 50].strip()
+            
+            append({
+                'pattern': pattern,
+                'matched_text': match.group(),
+                'suggestion': details['suggestion'],
+                'explanation': details['explanation'],
+                'category': details['category'],
+                'context': context,
+                'line_number': line_of(newlines, match_start) + 1,
+                'file_path': file_path
+            })
         
         return violations
     
@@ -168,16 +247,8 @@ class SuggestionEngine:
 """
     
     def track_violation(self, violation):
-        """Track violations for analytics"""
-        violations = []
-        if self.violations_file.exists():
-            try:
-                with open(self.violations_file) as f:
-                    violations = json.load(f)
-            except:
-                violations = []
-        
-        violations.append({
+        """Track violations for analytics (written in batches, see flush)"""
+        self._pending.append({
             'timestamp': datetime.now().isoformat(),
             'matched_text': violation['matched_text'],
             'category': violation['category'],
@@ -186,60 +257,152 @@ class SuggestionEngine:
             'session_id': os.environ.get('CLAUDE_SESSION_ID', 'unknown')
         })
         
-        # Keep last 1000 violations
-        violations = violations[-1000:]
-        
-        with open(self.violations_file, 'w') as f:
-            json.dump(violations, f, indent=2)
+        if len(self._pending) >= FLUSH_THRESHOLD:
+            self.flush()
+        elif not self._flush_registered:
+            atexit.register(self.close)
+            self._flush_registered = True
     
-    def get_common_mistakes(self, limit=5):
-        """Get most common violations for learning"""
-        if not self.violations_file.exists():
-            return []
+    def flush(self):
+        """Append tracked violations that haven't been saved yet, one JSON object per line"""
+        if not self._pending:
+            return
+        fd = self._violations_fd()
+        os.write(fd, _jsonl(self._pending).encode('utf-8'))
+        self._pending = []
         
+        # Keep last 1000 violations once the log has grown well past that,
+        # but only from a successful read so the history is never wiped
+        if os.lseek(fd, 0, os.SEEK_CUR) > MAX_LOG_BYTES:
+            violations = self._read_tail()
+            if violations:
+                tmp_path = self.violations_file.with_name(self.violations_file.name + '.tmp')
+                tmp_path.write_text(_jsonl(violations))
+                os.replace(tmp_path, self.violations_file)
+                self._close_fd()
+    
+    def _violations_fd(self):
+        """Append-mode descriptor for the violations log, kept open between flushes"""
+        # Reopen if the log was compacted (replaced) since it was opened
+        if self._vfd is not None and os.fstat(self._vfd).st_nlink == 0:
+            self._close_fd()
+        if self._vfd is None:
+            # Created on first write, so read-only use never touches the disk
+            if not SuggestionEngine._dir_ready:
+                self.analytics_dir.mkdir(parents=True, exist_ok=True)
+                SuggestionEngine._dir_ready = True
+            self._migrate_legacy()
+            self._vfd = os.open(self.violations_file, os.O_WRONLY | os.O_CREAT | os.O_APPEND, 0o644)
+        return self._vfd
+    
+    def _close_fd(self):
+        """Close the violations log descriptor if it's open"""
+        if self._vfd is not None:
+            os.close(self._vfd)
+            self._vfd = None
+    
+    def close(self):
+        """Flush tracked violations and close the violations log"""
+        self.flush()
+        self._close_fd()
+    
+    def _migrate_legacy(self):
+        """Move violations from the old JSON array file into the JSONL log"""
+        if self._legacy_checked:
+            return
+        self._legacy_checked = True
+        legacy_file = self.violations_file.with_suffix('.json')
+        if not legacy_file.exists() or self.violations_file.exists():
+            return
         try:
-            with open(self.violations_file) as f:
+            with open(legacy_file) as f:
                 violations = json.load(f)
         except:
+            return
+        with open(self.violations_file, 'w') as f:
+            f.write(_jsonl(violations[-MAX_VIOLATIONS:]))
+        legacy_file.unlink()
+    
+    def _read_violations(self):
+        """Read the most recent violations from the log, reparsing only when it changed"""
+        self._migrate_legacy()
+        try:
+            st = os.stat(self.violations_file)
+        except OSError:
             return []
         
-        # Count violations by matched text
-        violation_counts = Counter(v['matched_text'] for v in violations)
+        stamp = (st.st_mtime_ns, st.st_size)
+        if stamp != self._cache_stamp:
+            violations = self._read_tail()
+            if violations is None:
+                return []
+            self._violations_cache = violations
+            self._cache_stamp = stamp
+        return self._violations_cache
+    
+    def _read_tail(self):
+        """Parse the last MAX_VIOLATIONS log lines, skipping any that don't decode
+        
+        Returns None if the log couldn't be read at all.
+        """
+        try:
+            with open(self.violations_file, 'rb') as f:
+                lines = deque(f, maxlen=MAX_VIOLATIONS)
+        except OSError:
+            return None
+        
+        violations = []
+        for line in lines:
+            try:
+                violations.append(json.loads(line))
+            except ValueError:
+                continue
+        return violations
+    
+    def get_common_mistakes(self, limit=5):
+        """Get most common violations for learning"""
+        self.flush()
+        violations = self._read_violations()
+        
+        # Count violations by matched text, noting the first suggestion seen for each
+        violation_counts = Counter()
+        suggestions = {}
+        for v in violations:
+            text = v['matched_text']
+            violation_counts[text] += 1
+            suggestions.setdefault(text, v['suggestion'])
         
         # Format for display
-        common = []
-        for text, count in violation_counts.most_common(limit):
-            # Find the suggestion for this violation
-            suggestion = None
-            for v in violations:
-                if v['matched_text'] == text:
-                    suggestion = v['suggestion']
-                    break
-            
-            common.append({
+        return [
+            {
                 'text': text,
                 'count': count,
-                'suggestion': suggestion
-            })
-        
-        return common
+                'suggestion': suggestions[text]
+            }
+            for text, count in violation_counts.most_common(limit)
+        ]
     
     def get_category_stats(self):
         """Get violation statistics by category"""
-        if not self.violations_file.exists():
-            return {}
-        
-        try:
-            with open(self.violations_file) as f:
-                violations = json.load(f)
-        except:
-            return {}
+        self.flush()
+        violations = self._read_violations()
         
         # Count by category
         category_counts = Counter(v['category'] for v in violations)
         return dict(category_counts)
 
 
+# Shared engine so a process builds it once and batches violation writes
+_ENGINE = None
+
+def get_engine() -> SuggestionEngine:
+    """Get the process-wide SuggestionEngine"""
+    global _ENGINE
+    if _ENGINE is None:
+        _ENGINE = SuggestionEngine()
+    return _ENGINE
+
+
 # Make it importable
 if __name__ == "__main__":
     # Test the suggestion engine
@@ -0,0 +1,88 @@
+"""Tests for .claude/scripts/validate-hooks.py and its hook runner."""
+
+import importlib.util
+import json
+import sys
+from pathlib import Path
+
+import pytest
+
+SCRIPTS_DIR = Path(__file__).resolve().parent.parent / ".claude" / "scripts"
+sys.path.insert(0, str(SCRIPTS_DIR))
+
+import _hook_runner  # noqa: E402
+
+_spec = importlib.util.spec_from_file_location("validate_hooks", SCRIPTS_DIR / "validate-hooks.py")
+validate_hooks = importlib.util.module_from_spec(_spec)
+_spec.loader.exec_module(validate_hooks)
+
+VALID_HOOK = '''import json
+import sys
+
+def main():
+    json.load(sys.stdin)
+    sys.exit(0)
+
+if __name__ == "__main__":
+    main()
+'''
+
+
+def write_settings(tmp_path, hook_paths):
+    """Write a settings.json that runs each hook on PreToolUse."""
+    settings = {"hooks": {"PreToolUse": [{"command": ["python3", str(path)]} for path in hook_paths]}}
+    (tmp_path / ".claude" / "settings.json").write_text(json.dumps(settings))
+
+
+@pytest.fixture
+def hooks_dir(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    directory = Path(".claude/hooks")
+    directory.mkdir(parents=True)
+    return directory
+
+
+def test_statically_invalid_hooks_never_get_a_worker(hooks_dir, monkeypatch):
+    marker = Path("ran.txt")
+    side_effect = f'open({str(marker)!r}, "a").write("ran")\n'
+    hooks = {
+        "valid.py": VALID_HOOK,
+        "syntax.py": side_effect + VALID_HOOK + "def broken(:\n",
+        "no_entry.py": side_effect + "import json\nimport sys\nsys.exit(0)\n",
+        "action.py": side_effect + VALID_HOOK.replace("sys.exit(0)", 'print(json.dumps({"action": "continue"}))\n    sys.exit(0)'),
+    }
+    for name, source in hooks.items():
+        (hooks_dir / name).write_text(source)
+    write_settings(hooks_dir.parent.parent, [hooks_dir / name for name in hooks])
+
+    validator = validate_hooks.HookValidator(run_hooks=True)
+    launched = []
+    launch_hook = validator.launch_hook
+    monkeypatch.setattr(validator, "launch_hook", lambda path: (launched.append(path.name), launch_hook(path)))
+    validator.validate_all_hooks()
+
+    assert launched == ["valid.py"]
+    assert not marker.exists()
+    assert validator.valid_hooks == 1
+
+
+def test_hook_can_import_sibling_module(hooks_dir, capsys):
+    (hooks_dir / "helper.py").write_text("DECISION = 'approve'\n")
+    hook = hooks_dir / "uses_helper.py"
+    hook.write_text(
+        "import json\nimport sys\nfrom helper import DECISION\n\n"
+        "def main():\n"
+        "    print('noise', file=sys.stderr)\n"
+        "    print(json.dumps({'decision': DECISION}))\n"
+        "    sys.exit(0)\n\n"
+        "if __name__ == '__main__':\n"
+        "    main()\n"
+    )
+    saved_path = sys.path[:]
+
+    exit_code, stdout = _hook_runner.run_hook(str(hook), {})
+
+    assert exit_code == 0
+    assert json.loads(stdout) == {"decision": "approve"}
+    assert sys.path == saved_path
+    assert capsys.readouterr().err == ""